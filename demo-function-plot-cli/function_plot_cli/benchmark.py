@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import json
+import platform
+import time
+import tracemalloc
+from dataclasses import replace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Sequence
+
+from .config import PACKAGE_VERSION
+from .expression import validate_and_compile
+from .models import PlotConfig, PlotResult
+from .plotting import build_plot
+from .renderer import UNICODE_SYMBOLS, render
+from .storage import atomic_write_json
+
+
+def update_benchmark_json(path: Path, section: str, results: dict[str, object]) -> dict[str, object]:
+    try:
+        content = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError, OSError, UnicodeDecodeError):
+        content = {}
+    if not isinstance(content, dict):
+        content = {}
+
+    content["environment"] = {
+        "package_version": PACKAGE_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+    content[section] = {
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+        **results,
+    }
+    atomic_write_json(path, content, error_message="Could not write benchmark results.")
+    return content
+
+
+def benchmark_render(
+    sizes: Sequence[tuple[int, int]] = ((200, 50), (2000, 500)),
+    expression_text: str = "sin(x) * exp(-x**2 / 50)",
+    repeats: int = 3,
+) -> dict[str, object]:
+    compiled = validate_and_compile(expression_text)
+    results: list[dict[str, object]] = []
+    for width, height in sizes:
+        config = PlotConfig(x_min=-10, x_max=10, y_min=-1.5, y_max=1.5, width=width, height=height)
+        cell_plot = build_plot(compiled, config)
+        dot_plot = build_plot(compiled, replace(config, width=width * 2, height=height * 4))
+        variants: dict[str, Callable[[], object]] = {
+            "grid": lambda plot=cell_plot: "\n".join(_grid_lines(plot)),
+            "canvas": lambda plot=cell_plot: render(plot).text,
+            "braille": lambda plot=dot_plot: render(plot, braille=True).text,
+        }
+        entry: dict[str, object] = {"width": width, "height": height}
+        for name, run in variants.items():
+            entry[name] = _measure(run, repeats)
+        entry["braille"]["plotted_points"] = len(dot_plot.points)
+        entry["canvas"]["plotted_points"] = len(cell_plot.points)
+        results.append(entry)
+    return {"expression": expression_text, "repeats": repeats, "sizes": results}
+
+
+def _measure(run: Callable[[], object], repeats: int) -> dict[str, float]:
+    best = float("inf")
+    for _ in range(max(1, repeats)):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"best_ms": best * 1000.0, "peak_kib": peak / 1024.0}
+
+
+def _grid_lines(plot: PlotResult) -> list[str]:
+    symbols = UNICODE_SYMBOLS
+    grid = [[" " for _ in range(plot.config.width)] for _ in range(plot.config.height)]
+    if plot.axis_row is not None:
+        for col in range(plot.config.width):
+            grid[plot.axis_row][col] = symbols["axis_h"]
+    if plot.axis_col is not None:
+        for row in range(plot.config.height):
+            grid[row][plot.axis_col] = symbols["axis_v"]
+    if plot.axis_row is not None and plot.axis_col is not None:
+        grid[plot.axis_row][plot.axis_col] = symbols["axis_c"]
+    for row, col in sorted(plot.points):
+        if 0 <= row < plot.config.height and 0 <= col < plot.config.width:
+            grid[row][col] = symbols["curve"]
+    return [f"{symbols['frame_v']}{''.join(row)}{symbols['frame_v']}" for row in grid]
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+from .errors import EvaluationBudgetError, EvaluationCancelledError
+
+TRUNCATE = "truncate"
+RAISE = "raise"
+
+
+class CancellationToken:
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+@dataclass(frozen=True)
+class EvaluationBudget:
+    deadline_seconds: float | None = None
+    max_evaluations: int | None = None
+    check_every: int = 64
+    on_exhausted: str = TRUNCATE
+    clock: Callable[[], float] = field(default=time.monotonic, compare=False)
+
+
+class BudgetMeter:
+    def __init__(self, budget: EvaluationBudget | None, cancel_token: CancellationToken | None = None) -> None:
+        self._budget = budget or EvaluationBudget()
+        self._cancel_token = cancel_token
+        self._started = self._budget.clock()
+        self.evaluations = 0
+
+    @property
+    def chunk_size(self) -> int:
+        return max(1, self._budget.check_every)
+
+    def allowance(self) -> int:
+        if self._cancel_token is not None and self._cancel_token.cancelled:
+            return self._stop(EvaluationCancelledError("Sampling was cancelled."))
+
+        deadline = self._budget.deadline_seconds
+        if deadline is not None and self._budget.clock() - self._started >= deadline:
+            return self._stop(EvaluationBudgetError(f"Sampling exceeded its {deadline:g} s deadline."))
+
+        allowance = self.chunk_size
+        limit = self._budget.max_evaluations
+        if limit is not None:
+            remaining = limit - self.evaluations
+            if remaining <= 0:
+                return self._stop(EvaluationBudgetError(f"Sampling exceeded its budget of {limit} evaluations."))
+            allowance = min(allowance, remaining)
+        return allowance
+
+    def _stop(self, error: Exception) -> int:
+        if self._budget.on_exhausted == RAISE:
+            raise error
+        return 0
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+
+from .config import PACKAGE_VERSION
+from .errors import StorageError
+from .models import CompiledExpression, PlotConfig, PlotResult, RenderOutput
+from .storage import atomic_write_json
+
+_CACHE_FORMAT = 3
+_CACHE_SALT = f"function-plot-cli/{PACKAGE_VERSION}/{_CACHE_FORMAT}"
+_ENTRY_SUFFIX = ".json"
+
+
+def render_cache_key(
+    compiled: CompiledExpression,
+    config: PlotConfig,
+    unicode_mode: bool,
+    braille: bool = False,
+) -> str:
+    payload = json.dumps(
+        {
+            "salt": _CACHE_SALT,
+            "fingerprint": compiled.fingerprint,
+            "config": asdict(config),
+            "unicode_mode": unicode_mode,
+            "braille": braille,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load_cached_render(cache_dir: Path, key: str) -> tuple[PlotResult, RenderOutput] | None:
+    path = _entry_path(cache_dir, key)
+    try:
+        content = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (json.JSONDecodeError, OSError, UnicodeDecodeError):
+        _discard(path)
+        return None
+
+    try:
+        entry = _decode_entry(content)
+    except (KeyError, TypeError, ValueError):
+        _discard(path)
+        return None
+
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return entry
+
+
+def store_cached_render(
+    cache_dir: Path,
+    key: str,
+    plot: PlotResult,
+    output: RenderOutput,
+    max_entries: int = 64,
+) -> None:
+    if max_entries <= 0 or plot.markers or plot.truncated:
+        return
+
+    try:
+        atomic_write_json(
+            _entry_path(cache_dir, key),
+            _encode_entry(plot, output),
+            error_message="Could not persist render cache entry.",
+        )
+    except StorageError:
+        return
+    _evict_least_recently_used(cache_dir, max_entries)
+
+
+def _entry_path(cache_dir: Path, key: str) -> Path:
+    return cache_dir / f"{key}{_ENTRY_SUFFIX}"
+
+
+def _encode_entry(plot: PlotResult, output: RenderOutput) -> dict[str, object]:
+    return {
+        "salt": _CACHE_SALT,
+        "plot": {
+            "expression_text": plot.expression_text,
+            "config": asdict(plot.config),
+            "points": sorted([row, col] for row, col in plot.points),
+            "axis_row": plot.axis_row,
+            "axis_col": plot.axis_col,
+            "clipped_points": plot.clipped_points,
+            "samples": list(plot.samples),
+            "derivative_points": sorted([row, col] for row, col in plot.derivative_points),
+            "derivative_samples": list(plot.derivative_samples),
+        },
+        "render": {
+            "text": output.text,
+            "metadata": output.metadata,
+        },
+    }
+
+
+def _decode_entry(content: object) -> tuple[PlotResult, RenderOutput]:
+    if not isinstance(content, dict) or content.get("salt") != _CACHE_SALT:
+        raise ValueError("Cache entry has an unexpected format.")
+
+    plot_data = content["plot"]
+    render_data = content["render"]
+    plot = PlotResult(
+        expression_text=str(plot_data["expression_text"]),
+        config=PlotConfig(**plot_data["config"]),
+        points={(int(row), int(col)) for row, col in plot_data["points"]},
+        axis_row=_optional_int(plot_data["axis_row"]),
+        axis_col=_optional_int(plot_data["axis_col"]),
+        markers=(),
+        clipped_points=int(plot_data["clipped_points"]),
+        samples=_decode_samples(plot_data["samples"]),
+        derivative_points={(int(row), int(col)) for row, col in plot_data["derivative_points"]},
+        derivative_samples=_decode_samples(plot_data["derivative_samples"]),
+    )
+    metadata = render_data["metadata"]
+    if not isinstance(render_data["text"], str) or not isinstance(metadata, dict):
+        raise ValueError("Cache entry has an unexpected format.")
+    output = RenderOutput(
+        text=render_data["text"],
+        metadata={str(name): str(value) for name, value in metadata.items()},
+    )
+    return plot, output
+
+
+def _decode_samples(values: list[object]) -> tuple[float | None, ...]:
+    return tuple(None if value is None else float(value) for value in values)
+
+
+def _optional_int(value: object) -> int | None:
+    if value is None:
+        return None
+    return int(value)
+
+
+def _evict_least_recently_used(cache_dir: Path, max_entries: int) -> None:
+    entries: list[tuple[float, Path]] = []
+    try:
+        for path in cache_dir.glob(f"*{_ENTRY_SUFFIX}"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+    except OSError:
+        return
+
+    if len(entries) <= max_entries:
+        return
+
+    entries.sort()
+    for _, path in entries[: len(entries) - max_entries]:
+        _discard(path)
+
+
+def _discard(path: Path) -> None:
+    try:
+        path.unlink(missing_ok=True)
+    except OSError:
+        pass
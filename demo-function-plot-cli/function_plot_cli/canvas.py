@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import codecs
+from typing import Iterator, Mapping, Sequence
+
+_SET_BIT = [bytes(value | 1 << bit for value in range(256)) for bit in range(8)]
+_ANY_BIT = bytes(1 if value else 0 for value in range(256))
+_BRAILLE_BASE = 0x2800
+_BRAILLE_WEIGHTS = (
+    (0x01, 0x08),
+    (0x02, 0x10),
+    (0x04, 0x20),
+    (0x40, 0x80),
+)
+_BRAILLE_TABLE = "".join(chr(_BRAILLE_BASE + code) for code in range(256))
+
+
+# Each cell is one byte whose bits are the layers, so a whole plot is a single
+# width x height bytearray and rows are encoded with C-level byte operations.
+class BitCanvas:
+    def __init__(self, width: int, height: int, layers: Sequence[str]) -> None:
+        if len(layers) > 8:
+            raise ValueError("BitCanvas supports at most 8 layers.")
+        self.width = width
+        self.height = height
+        self.layers = tuple(layers)
+        self._bit = {name: bit for bit, name in enumerate(self.layers)}
+        self._cells = bytearray(width * height)
+
+    def set(self, layer: str, x: int, y: int) -> None:
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self._cells[y * self.width + x] |= 1 << self._bit[layer]
+
+    def get(self, layer: str, x: int, y: int) -> bool:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        return bool(self._cells[y * self.width + x] >> self._bit[layer] & 1)
+
+    def fill_row(self, layer: str, y: int) -> None:
+        if 0 <= y < self.height:
+            start = y * self.width
+            row = self._cells[start : start + self.width]
+            self._cells[start : start + self.width] = row.translate(_SET_BIT[self._bit[layer]])
+
+    def fill_column(self, layer: str, x: int) -> None:
+        if 0 <= x < self.width:
+            column = self._cells[x :: self.width]
+            self._cells[x :: self.width] = column.translate(_SET_BIT[self._bit[layer]])
+
+    def encode_cells(self, table: Mapping[int, str]) -> Iterator[str]:
+        characters = "".join(table.get(code, chr(code)) for code in range(256))
+        cells = _decode(self._cells, characters)
+        for y in range(self.height):
+            yield cells[y * self.width : (y + 1) * self.width]
+
+    def encode_braille(self) -> Iterator[str]:
+        cell_width = (self.width + 1) // 2
+        pixels = self._cells.translate(_ANY_BIT)
+        for band in range(0, self.height, 4):
+            codes = 0
+            for offset in range(min(4, self.height - band)):
+                start = (band + offset) * self.width
+                row = pixels[start : start + self.width].ljust(cell_width * 2, b"\x00")
+                left_weight, right_weight = _BRAILLE_WEIGHTS[offset]
+                codes |= int.from_bytes(row[0::2], "big") * left_weight
+                codes |= int.from_bytes(row[1::2], "big") * right_weight
+            yield _decode(codes.to_bytes(cell_width, "big"), _BRAILLE_TABLE)
+
+
+# charmap_decode maps every byte through a 256-character string in C, which
+# is much faster than str.translate once the targets are outside Latin-1.
+def _decode(codes: bytes | bytearray, table: str) -> str:
+    return codecs.charmap_decode(codes, "strict", table)[0]
+
+
+def layer_table(layers: Sequence[str], symbols: Mapping[str, str], blank: str = " ") -> dict[int, str]:
+    table: dict[int, str] = {}
+    for code in range(1 << len(layers)):
+        active = {layer for bit, layer in enumerate(layers) if code >> bit & 1}
+        table[code] = next((symbols[layer] for layer in reversed(layers) if layer in active), blank)
+    return table
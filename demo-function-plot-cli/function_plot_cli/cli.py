@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import argparse
+import sys
+import time
+from dataclasses import replace
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterable, Iterator, Sequence
 
-from .config import AppConfig, default_recents_path
+from .benchmark import benchmark_render, update_benchmark_json
+from .budget import EvaluationBudget
+from .cache import load_cached_render, render_cache_key, store_cached_render
+from .config import AppConfig, default_recents_path, default_render_cache_dir
 from .errors import (
     ExportError,
     ExpressionDomainError,
@@ -11,44 +18,85 @@ from .errors import (
     InputValidationError,
     StorageError,
 )
-from .exporter import export_rendered_plot
-from .expression import evaluate, validate_and_compile
-from .input_parser import normalize_expression, parse_float
-from .models import MarkedPoint, PlotConfig, RenderOutput
-from .plotting import build_plot
-from .renderer import render
+from .exporter import export_plot
+from .expression import (
+    DefinitionRegistry,
+    evaluate,
+    evaluate_batch,
+    evaluate_batch_with_derivative,
+    evaluate_with_derivative,
+    expanded_expression_text,
+    is_definition,
+)
+from .integration import integrate
+from .input_parser import normalize_expression, parse_float, parse_float_values
+from .models import MarkedPoint, PlotConfig, PlotResult, RenderOutput
+from .plotting import build_plot, build_plot_progressive, with_markers
+from .renderer import render_lines, render_metadata
+from .screen import MENU_REGION, MESSAGES_REGION, PLOT_REGION, AnsiScreen
 from .storage import clear_recent_functions, load_recent_functions, save_recent_function
-from .ui import build_main_menu, format_status
+from .ui import build_main_menu, build_status_line, format_evaluation_table, format_status
+from .watch import watch_file
 
 
 def main(
     input_fn: Callable[[str], str] = input,
     output_fn: Callable[[str], None] = print,
     config: AppConfig | None = None,
+    recents_path: Path | None = None,
+    cache_dir: Path | None = None,
 ) -> int:
     app_config = config or AppConfig()
-    recents_path = default_recents_path()
+    recents_path = recents_path or default_recents_path()
+    cache_dir = cache_dir or default_render_cache_dir()
+
+    screen = _open_screen(app_config, output_fn)
+    show_plot = _line_writer(output_fn)
+    show_preview = None
+    if screen is not None:
+        input_fn = _refreshing_input(screen, input_fn)
+        output_fn = _region_writer(screen, MESSAGES_REGION)
+        show_plot = _plot_region_writer(screen)
+        show_preview = _plot_preview_writer(screen)
+    base_config = app_config
 
+    definitions = DefinitionRegistry()
     active_expression_text: str | None = None
     active_compiled = None
-    last_render: RenderOutput | None = None
+    last_plot: PlotResult | None = None
 
     while True:
         recents_count = len(load_recent_functions(recents_path))
-        output_fn(build_main_menu(active_expression_text, recents_count))
-        choice = input_fn("Select option [1-5]: ").strip().lower()
+        menu = build_main_menu(active_expression_text, recents_count)
+        if screen is not None:
+            app_config = _fit_plot_to_screen(base_config, screen)
+            screen.set_region(MENU_REGION, menu, compact=build_status_line(active_expression_text))
+        else:
+            output_fn(menu)
+        choice = input_fn("Select option [1-6]: ").strip().lower()
+        if screen is not None:
+            screen.clear_region(MESSAGES_REGION)
 
         if choice in {"5", "q"}:
             output_fn(format_status("info", "Bye."))
+            if screen is not None:
+                screen.refresh()
             return 0
 
         if choice == "1":
             expression_text = input_fn("Enter function f(x): ")
-            active_expression_text, active_compiled, last_render = _plot_expression(
+            if is_definition(expression_text):
+                _define_helper(expression_text, definitions, output_fn)
+                continue
+            active_expression_text, active_compiled, last_plot = _plot_expression(
                 expression_text,
                 app_config,
                 recents_path,
+                cache_dir,
+                definitions,
                 output_fn,
+                show_plot,
+                show_preview,
             )
             continue
 
@@ -56,23 +104,20 @@ def main(
             if active_compiled is None:
                 output_fn(format_status("warn", "No active function. Plot a function first."))
                 continue
-            x_text = input_fn("Enter x value: ")
+            x_text = input_fn("Enter x value, list, start:stop:step range or file: ")
             try:
-                x_value = parse_float(x_text, field_name="x")
-                y_value = evaluate(active_compiled, x_value)
-            except (InputValidationError, ExpressionDomainError, ExpressionValidationError) as error:
+                x_values = parse_float_values(x_text, field_name="x")
+            except InputValidationError as error:
                 output_fn(format_status("error", str(error)))
                 continue
 
-            marker = MarkedPoint(x=x_value, y=y_value)
-            plot = build_plot(active_compiled, _plot_config(app_config), marker)
-            last_render = render(plot, unicode_mode=app_config.unicode_mode)
-            output_fn(f"Result: x = {x_value:.3f}, y = {y_value:.3f}")
-            if plot.marker is not None and plot.marker.visible:
-                output_fn(format_status("ok", "Marker placed on visible graph."))
+            if len(x_values) == 1:
+                plot = _evaluate_and_mark(active_compiled, x_values[0], last_plot, app_config, output_fn)
             else:
-                output_fn(format_status("warn", "Marker is outside visible range."))
-            output_fn(last_render.text)
+                plot = _evaluate_and_mark_many(active_compiled, x_values, last_plot, app_config, output_fn)
+            if plot is not None:
+                last_plot = plot
+                show_plot(render_lines(plot, unicode_mode=app_config.unicode_mode, braille=_braille(app_config)))
             continue
 
         if choice == "3":
@@ -96,64 +141,298 @@ def main(
                 output_fn(format_status("error", "Recent index out of range."))
                 continue
 
-            active_expression_text, active_compiled, last_render = _plot_expression(
+            active_expression_text, active_compiled, last_plot = _plot_expression(
                 recents[index],
                 app_config,
                 recents_path,
+                cache_dir,
+                definitions,
                 output_fn,
+                show_plot,
+                show_preview,
             )
             continue
 
         if choice == "4":
-            if last_render is None:
+            if last_plot is None:
                 output_fn(format_status("error", "No rendered plot available. Plot a function first."))
                 continue
             path_text = input_fn("Output path (.txt): ")
             export_path = Path(path_text.strip())
             try:
-                export_rendered_plot(export_path, last_render)
+                export_plot(
+                    export_path,
+                    last_plot,
+                    unicode_mode=app_config.unicode_mode,
+                    braille=_braille(app_config),
+                )
             except ExportError as error:
                 output_fn(format_status("error", str(error)))
                 continue
             output_fn(format_status("ok", f"Plot exported to {export_path}"))
             continue
 
-        output_fn(format_status("error", "Unknown option. Use values 1-5."))
+        if choice == "6":
+            if active_compiled is None:
+                output_fn(format_status("warn", "No active function. Plot a function first."))
+                continue
+            _integrate_active(active_compiled, last_plot, input_fn, output_fn)
+            continue
+
+        output_fn(format_status("error", "Unknown option. Use values 1-6."))
 
 
 def _plot_config(config: AppConfig) -> PlotConfig:
+    dots_per_cell = (2, 4) if _braille(config) else (1, 1)
     return PlotConfig(
         x_min=config.x_min,
         x_max=config.x_max,
         y_min=config.y_min,
         y_max=config.y_max,
-        width=config.plot_width,
-        height=config.plot_height,
+        width=config.plot_width * dots_per_cell[0],
+        height=config.plot_height * dots_per_cell[1],
+        auto_y=config.auto_y_range,
+        derivative=config.show_derivative,
     )
 
 
+def _braille(config: AppConfig) -> bool:
+    return config.braille_mode and config.unicode_mode
+
+
+def _plot_budget(config: AppConfig) -> EvaluationBudget | None:
+    if config.plot_deadline_seconds is None:
+        return None
+    return EvaluationBudget(deadline_seconds=config.plot_deadline_seconds)
+
+
 def _plot_expression(
     expression_text: str,
     app_config: AppConfig,
     recents_path: Path,
+    cache_dir: Path,
+    definitions: DefinitionRegistry,
     output_fn: Callable[[str], None],
+    show_plot: Callable[[Iterable[str]], None],
+    show_preview: Callable[[Iterable[str]], None] | None = None,
 ):
     try:
         normalized = normalize_expression(expression_text)
-        compiled = validate_and_compile(normalized)
+        compiled = definitions.compile(normalized)
     except (InputValidationError, ExpressionValidationError) as error:
         output_fn(format_status("error", str(error)))
         return None, None, None
 
-    plot = build_plot(compiled, _plot_config(app_config))
-    output = render(plot, unicode_mode=app_config.unicode_mode)
+    plot_config = _plot_config(app_config)
+    braille = _braille(app_config)
+    cache_key = render_cache_key(compiled, plot_config, app_config.unicode_mode, braille)
+    cached = None
+    if app_config.render_cache_limit > 0:
+        cached = load_cached_render(cache_dir, cache_key)
+
+    timing = None
+    if cached is not None:
+        plot, output = cached
+        if plot.expression_text != compiled.expression_text:
+            plot = replace(plot, expression_text=compiled.expression_text)
+            lines: Iterable[str] = render_lines(plot, unicode_mode=app_config.unicode_mode, braille=braille)
+        else:
+            lines = output.text.split("\n")
+    elif app_config.progressive_render:
+        started = time.perf_counter()
+        first_plot_ms = None
+        if show_preview is None:
+            plot = build_plot(
+                compiled,
+                plot_config,
+                budget=_plot_budget(app_config),
+                workers=app_config.sampling_workers,
+            )
+        else:
+            for plot in build_plot_progressive(
+                compiled,
+                plot_config,
+                budget=_plot_budget(app_config),
+                workers=app_config.sampling_workers,
+            ):
+                show_preview(render_lines(plot, unicode_mode=app_config.unicode_mode, braille=braille))
+                if first_plot_ms is None:
+                    first_plot_ms = (time.perf_counter() - started) * 1000.0
+        total_ms = (time.perf_counter() - started) * 1000.0
+        lines = _caching_lines(plot, app_config, cache_dir, cache_key)
+        first_ms = total_ms if first_plot_ms is None else first_plot_ms
+        timing = f"First plot in {first_ms:.1f} ms, full plot in {total_ms:.1f} ms."
+    else:
+        plot = build_plot(
+            compiled,
+            plot_config,
+            budget=_plot_budget(app_config),
+            workers=app_config.sampling_workers,
+        )
+        lines = _caching_lines(plot, app_config, cache_dir, cache_key)
     try:
-        save_recent_function(recents_path, normalized, max_items=app_config.recents_limit)
+        save_recent_function(
+            recents_path,
+            expanded_expression_text(compiled) if compiled.helpers else normalized,
+            max_items=app_config.recents_limit,
+            key=_recent_key(definitions),
+        )
     except StorageError as error:
         output_fn(format_status("warn", str(error)))
     output_fn(format_status("ok", "Function plotted."))
-    output_fn(output.text)
-    return normalized, compiled, output
+    if timing is not None:
+        output_fn(format_status("info", timing))
+    show_plot(lines)
+    return normalized, compiled, plot
+
+
+# Streams the rendered lines to the caller and stores the same lines in the
+# render cache once they have all been produced, so a fresh plot is rendered
+# exactly once.
+def _caching_lines(plot: PlotResult, app_config: AppConfig, cache_dir: Path, cache_key: str) -> Iterator[str]:
+    braille = _braille(app_config)
+    collected: list[str] = []
+    for line in render_lines(plot, unicode_mode=app_config.unicode_mode, braille=braille):
+        collected.append(line)
+        yield line
+    if app_config.render_cache_limit > 0:
+        output = RenderOutput(
+            text="\n".join(collected),
+            metadata=render_metadata(plot, unicode_mode=app_config.unicode_mode, braille=braille),
+        )
+        store_cached_render(cache_dir, cache_key, plot, output, max_entries=app_config.render_cache_limit)
+
+
+def _evaluate_and_mark(
+    compiled,
+    x_value: float,
+    last_plot: PlotResult | None,
+    app_config: AppConfig,
+    output_fn: Callable[[str], None],
+) -> PlotResult | None:
+    try:
+        if app_config.show_derivative:
+            y_value, slope = evaluate_with_derivative(compiled, x_value)
+        else:
+            y_value = evaluate(compiled, x_value)
+    except (ExpressionDomainError, ExpressionValidationError) as error:
+        output_fn(format_status("error", str(error)))
+        return None
+
+    plot = _marked_plot(compiled, [MarkedPoint(x=x_value, y=y_value)], last_plot, app_config)
+    output_fn(f"Result: x = {x_value:.3f}, y = {y_value:.3f}")
+    if app_config.show_derivative:
+        slope_text = "undefined" if slope is None else f"{slope:.3f}"
+        output_fn(f"Derivative: f'(x) = {slope_text}")
+    if plot.markers[0].visible:
+        output_fn(format_status("ok", "Marker placed on visible graph."))
+    else:
+        output_fn(format_status("warn", "Marker is outside visible range."))
+    return plot
+
+
+def _evaluate_and_mark_many(
+    compiled,
+    x_values: list[float],
+    last_plot: PlotResult | None,
+    app_config: AppConfig,
+    output_fn: Callable[[str], None],
+) -> PlotResult:
+    slopes = None
+    if app_config.show_derivative:
+        pairs = evaluate_batch_with_derivative(compiled, x_values)
+        y_values = [value for value, _ in pairs]
+        slopes = [slope for _, slope in pairs]
+    else:
+        y_values = evaluate_batch(compiled, x_values)
+
+    markers = [MarkedPoint(x=x_value, y=y_value) for x_value, y_value in zip(x_values, y_values) if y_value is not None]
+    plot = _marked_plot(compiled, markers, last_plot, app_config)
+    output_fn(format_evaluation_table(x_values, y_values, slopes))
+
+    undefined = len(x_values) - len(markers)
+    if undefined:
+        output_fn(format_status("warn", f"f(x) is undefined for {undefined} of {len(x_values)} values."))
+    visible = sum(1 for marker in plot.markers if marker.visible)
+    if visible:
+        output_fn(format_status("ok", f"Marked {visible} of {len(x_values)} points on visible graph."))
+    else:
+        output_fn(format_status("warn", "No evaluated point is inside the visible range."))
+    return plot
+
+
+# Marking only adds markers, so the last plot of the same expression and
+# settings is reused instead of re-sampling the whole x-grid.
+def _marked_plot(
+    compiled,
+    markers: list[MarkedPoint],
+    last_plot: PlotResult | None,
+    app_config: AppConfig,
+) -> PlotResult:
+    plot_config = _plot_config(app_config)
+    if _plot_matches(last_plot, compiled, plot_config):
+        return with_markers(last_plot, markers)
+    return build_plot(
+        compiled,
+        plot_config,
+        markers,
+        budget=_plot_budget(app_config),
+        workers=app_config.sampling_workers,
+    )
+
+
+def _plot_matches(plot: PlotResult | None, compiled, plot_config: PlotConfig) -> bool:
+    if plot is None or plot.truncated or plot.expression_text != compiled.expression_text:
+        return False
+    if plot_config.auto_y:
+        return replace(plot.config, y_min=plot_config.y_min, y_max=plot_config.y_max) == plot_config
+    return plot.config == plot_config
+
+
+def _recent_key(definitions: DefinitionRegistry) -> Callable[[str], str]:
+    def key(expression_text: str) -> str:
+        try:
+            return definitions.compile(normalize_expression(expression_text)).fingerprint
+        except (InputValidationError, ExpressionValidationError):
+            return expression_text
+
+    return key
+
+
+def _integrate_active(
+    compiled,
+    plot: PlotResult | None,
+    input_fn: Callable[[str], str],
+    output_fn: Callable[[str], None],
+) -> None:
+    try:
+        lower = parse_float(input_fn("Enter lower bound a: "), field_name="a")
+        upper = parse_float(input_fn("Enter upper bound b: "), field_name="b")
+        result = integrate(compiled, lower, upper, plot=plot)
+    except (InputValidationError, ExpressionDomainError) as error:
+        output_fn(format_status("error", str(error)))
+        return
+
+    output_fn(
+        f"Integral: [{result.lower:g}, {result.upper:g}] f(x) dx = {result.value:.6g} "
+        f"(est. error {result.error_estimate:.2g}, {result.evaluations} evaluations, "
+        f"{result.reused_samples} plot samples reused)"
+    )
+    if not result.converged:
+        output_fn(format_status("warn", "Integration did not converge; f(x) may be singular on this interval."))
+
+
+def _define_helper(
+    definition_text: str,
+    definitions: DefinitionRegistry,
+    output_fn: Callable[[str], None],
+) -> None:
+    try:
+        definition = definitions.define(definition_text)
+    except ExpressionValidationError as error:
+        output_fn(format_status("error", str(error)))
+        return
+    output_fn(format_status("ok", f"Defined {definition.name}({definition.parameter}) = {definition.body_text}"))
 
 
 def _show_recents(
@@ -172,5 +451,221 @@ def _show_recents(
         output_fn(f"{index}) {expression_text}")
 
 
+def _open_screen(config: AppConfig, output_fn: Callable[[str], None]) -> AnsiScreen | None:
+    if not config.screen_mode or output_fn is not print:
+        return None
+    if not sys.stdout.isatty():
+        return None
+
+    def write(text: str) -> None:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    return AnsiScreen(write)
+
+
+# Rows kept free next to the plot in screen mode: the plot title, both frame
+# rows, up to five metadata lines, the one-line menu, one message line and
+# the prompt rows.
+_SCREEN_RESERVED_ROWS = 12
+
+
+def _fit_plot_to_screen(config: AppConfig, screen: AnsiScreen) -> AppConfig:
+    width = max(1, min(config.plot_width, screen.columns - 2))
+    height = max(1, min(config.plot_height, screen.rows - _SCREEN_RESERVED_ROWS))
+    if (width, height) == (config.plot_width, config.plot_height):
+        return config
+    return replace(config, plot_width=width, plot_height=height)
+
+
+def _refreshing_input(screen: AnsiScreen, input_fn: Callable[[str], str]) -> Callable[[str], str]:
+    def prompt(text: str) -> str:
+        screen.refresh()
+        answer = input_fn(text)
+        if len(text) + len(answer) >= screen.columns:
+            # A wrapped answer may have scrolled the terminal under the frame.
+            screen.invalidate()
+        return answer
+
+    return prompt
+
+
+def _line_writer(output_fn: Callable[[str], None]) -> Callable[[Iterable[str]], None]:
+    def write(lines: Iterable[str]) -> None:
+        for line in lines:
+            output_fn(line)
+
+    return write
+
+
+def _plot_region_writer(screen: AnsiScreen) -> Callable[[Iterable[str]], None]:
+    def write(lines: Iterable[str]) -> None:
+        screen.set_region(PLOT_REGION, "\n".join(lines))
+
+    return write
+
+
+def _plot_preview_writer(screen: AnsiScreen) -> Callable[[Iterable[str]], None]:
+    def write(lines: Iterable[str]) -> None:
+        screen.set_region(PLOT_REGION, "\n".join(lines))
+        screen.refresh()
+
+    return write
+
+
+def _region_writer(screen: AnsiScreen, region: str) -> Callable[[str], None]:
+    def write(text: str) -> None:
+        screen.append(region, text)
+
+    return write
+
+
+def run(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="function_plot_cli", description="Menu-driven terminal function plotter.")
+    parser.add_argument(
+        "--screen",
+        action="store_true",
+        help="redraw only changed regions with ANSI cursor addressing (terminals only)",
+    )
+    parser.add_argument(
+        "--auto-y",
+        action="store_true",
+        help="fit the y-range to the sampled values instead of the fixed default",
+    )
+    parser.add_argument(
+        "--derivative",
+        action="store_true",
+        help="overlay f'(x) computed by forward-mode differentiation",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        metavar="SECONDS",
+        help="stop sampling a plot after this many seconds and show the partial result",
+    )
+    parser.add_argument(
+        "--braille",
+        action="store_true",
+        help="draw with Braille dots (2x4 samples per character cell)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="sample very wide plots in N worker processes (small plots stay in-process)",
+    )
+    parser.add_argument(
+        "--progressive",
+        action="store_true",
+        help="show a coarse plot first and refine it in place (screen mode), then report timings",
+    )
+    subcommands = parser.add_subparsers(dest="command")
+    watch_parser = subcommands.add_parser("watch", help="re-plot a file of expressions whenever it changes")
+    watch_parser.add_argument("path", type=Path, help="text file with one expression per line")
+    watch_parser.add_argument("--interval", type=float, default=0.5, help="polling interval in seconds")
+    watch_parser.add_argument("--debounce", type=float, default=0.2, help="quiet period before re-plotting a save")
+    replay_parser = subcommands.add_parser("replay", help="time a scripted menu session and record latencies")
+    replay_parser.add_argument("--script", type=Path, help="JSON list of {action, inputs} steps")
+    replay_parser.add_argument("--repeat", type=int, default=10, help="number of times to replay the script")
+    replay_parser.add_argument("--width", type=int, default=AppConfig.plot_width, help="plot width in columns")
+    replay_parser.add_argument("--height", type=int, default=AppConfig.plot_height, help="plot height in rows")
+    replay_parser.add_argument("--output", type=Path, default=Path("benchmark.json"), help="benchmark JSON to update")
+    render_bench_parser = subcommands.add_parser("bench-render", help="compare renderer time and memory")
+    render_bench_parser.add_argument(
+        "--size",
+        action="append",
+        type=_parse_size,
+        dest="sizes",
+        metavar="WIDTHxHEIGHT",
+        help="canvas size in character cells (repeatable, default 200x50 and 2000x500)",
+    )
+    render_bench_parser.add_argument("--repeats", type=int, default=3, help="timing repetitions per renderer")
+    render_bench_parser.add_argument("--output", type=Path, default=Path("benchmark.json"), help="benchmark JSON to update")
+    args = parser.parse_args(argv)
+
+    app_config = AppConfig(
+        screen_mode=args.screen,
+        auto_y_range=args.auto_y,
+        show_derivative=args.derivative,
+        plot_deadline_seconds=args.deadline,
+        braille_mode=args.braille,
+        sampling_workers=args.workers,
+        progressive_render=args.progressive,
+    )
+    if args.command == "watch":
+        try:
+            return watch_file(
+                args.path,
+                app_config,
+                _plot_config(app_config),
+                poll_interval=args.interval,
+                debounce=args.debounce,
+            )
+        except KeyboardInterrupt:
+            return 0
+    if args.command == "replay":
+        return _run_replay(args, app_config)
+    if args.command == "bench-render":
+        return _run_render_benchmark(args)
+    return main(config=app_config)
+
+
+def _parse_size(value: str) -> tuple[int, int]:
+    width_text, _, height_text = value.lower().partition("x")
+    try:
+        width, height = int(width_text), int(height_text)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError("size must look like 200x50") from error
+    if width < 1 or height < 1:
+        raise argparse.ArgumentTypeError("size must be positive")
+    return width, height
+
+
+def _run_render_benchmark(args: argparse.Namespace) -> int:
+    results = benchmark_render(sizes=args.sizes or ((200, 50), (2000, 500)), repeats=args.repeats)
+    try:
+        update_benchmark_json(args.output, "render", results)
+    except StorageError as error:
+        print(format_status("error", str(error)))
+        return 1
+
+    for entry in results["sizes"]:
+        for name in ("grid", "canvas", "braille"):
+            stats = entry[name]
+            print(
+                f"{entry['width']}x{entry['height']} {name:<8} {stats['best_ms']:.2f} ms "
+                f"peak {stats['peak_kib']:.0f} KiB"
+            )
+    print(format_status("ok", f"Results saved to {args.output}"))
+    return 0
+
+
+def _run_replay(args: argparse.Namespace, app_config: AppConfig) -> int:
+    from .replay import DEFAULT_SCRIPT, load_script, replay_session
+
+    config = replace(app_config, plot_width=args.width, plot_height=args.height, unicode_mode=False)
+    try:
+        script = load_script(args.script) if args.script else DEFAULT_SCRIPT
+        results = replay_session(script, repeat=args.repeat, config=config)
+        update_benchmark_json(args.output, "replay", results)
+    except (InputValidationError, StorageError) as error:
+        print(format_status("error", str(error)))
+        return 1
+
+    for action, stats in results["actions"].items():
+        print(
+            f"{action:<8} n={stats['count']:<4} cold={_format_ms(stats['cold_ms'])} "
+            f"warm p50={_format_ms(stats['p50_ms'])} p95={_format_ms(stats['p95_ms'])} "
+            f"p99={_format_ms(stats['p99_ms'])} bytes={stats['output_bytes']}"
+        )
+    print(format_status("ok", f"{results['output_bytes']} bytes written; results saved to {args.output}"))
+    return 0
+
+
+def _format_ms(value: float | None) -> str:
+    return "-" if value is None else f"{value:.2f} ms"
+
+
 if __name__ == "__main__":
-    raise SystemExit(main())
+    raise SystemExit(run())
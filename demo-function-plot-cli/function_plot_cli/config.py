@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 
+PACKAGE_VERSION = "0.1.0"
+
 
 @dataclass(frozen=True)
 class AppConfig:
@@ -14,7 +16,19 @@ class AppConfig:
     plot_height: int = 20
     recents_limit: int = 10
     unicode_mode: bool = True
+    render_cache_limit: int = 64
+    screen_mode: bool = False
+    auto_y_range: bool = False
+    show_derivative: bool = False
+    plot_deadline_seconds: float | None = None
+    braille_mode: bool = False
+    sampling_workers: int = 1
+    progressive_render: bool = False
 
 
 def default_recents_path() -> Path:
     return Path.home() / ".function_plot_cli_recents.json"
+
+
+def default_render_cache_dir() -> Path:
+    return Path.home() / ".function_plot_cli_cache"
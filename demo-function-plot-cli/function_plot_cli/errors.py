@@ -20,3 +20,11 @@ class StorageError(FunctionPlotCliError):
 
 class ExportError(FunctionPlotCliError):
     """Raised when export operation fails."""
+
+
+class EvaluationBudgetError(FunctionPlotCliError):
+    """Raised when sampling exceeds its deadline or evaluation budget."""
+
+
+class EvaluationCancelledError(FunctionPlotCliError):
+    """Raised when sampling is cancelled through a cancellation token."""
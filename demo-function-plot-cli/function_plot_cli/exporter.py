@@ -2,12 +2,26 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterable, Mapping
 
 from .errors import ExportError
-from .models import RenderOutput
+from .models import PlotResult, RenderOutput
+from .renderer import render_lines, render_metadata
 
 
 def export_rendered_plot(path: Path, output: RenderOutput) -> None:
+    export_plot_lines(path, output.metadata, (output.text,))
+
+
+def export_plot(path: Path, plot: PlotResult, unicode_mode: bool = True, braille: bool = False) -> None:
+    export_plot_lines(
+        path,
+        render_metadata(plot, unicode_mode=unicode_mode, braille=braille),
+        render_lines(plot, unicode_mode=unicode_mode, braille=braille),
+    )
+
+
+def export_plot_lines(path: Path, metadata: Mapping[str, str], lines: Iterable[str]) -> None:
     if path.suffix.lower() != ".txt":
         raise ExportError("Output file must use .txt extension.")
 
@@ -18,15 +32,18 @@ def export_rendered_plot(path: Path, output: RenderOutput) -> None:
     header = [
         "Function Plot CLI Export",
         f"Timestamp: {timestamp}",
-        f"Function: {output.metadata.get('function', '')}",
-        f"Range: x={output.metadata.get('x_range', '')}, y={output.metadata.get('y_range', '')}",
-        f"Marker: {output.metadata.get('marker', 'none')}",
-        f"Render mode: {output.metadata.get('render_mode', 'unicode')}",
+        f"Function: {metadata.get('function', '')}",
+        f"Range: x={metadata.get('x_range', '')}, y={metadata.get('y_range', '')}",
+        f"Marker: {metadata.get('marker', 'none')}",
+        f"Render mode: {metadata.get('render_mode', 'unicode')}",
         "",
     ]
-    payload = "\n".join(header) + output.text + "\n"
 
     try:
-        path.write_text(payload, encoding="utf-8")
+        with path.open("w", encoding="utf-8") as handle:
+            handle.write("\n".join(header))
+            for line in lines:
+                handle.write(line)
+                handle.write("\n")
     except OSError as error:
         raise ExportError("Cannot write export file.") from error
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 import ast
+import hashlib
 import math
+import operator
+import re
+import time
+from dataclasses import dataclass
+from typing import Callable, Mapping, Sequence
 
 from .errors import ExpressionDomainError, ExpressionValidationError
-from .models import CompiledExpression
+from .models import CompiledExpression, FunctionDefinition
 
 _ALLOWED_FUNCTIONS = {
     "sin": math.sin,
@@ -32,38 +38,324 @@ _ALLOWED_AST_NODES = (
     *_ALLOWED_UNARYOPS,
 )
 _MAX_AST_NODES = 200
+_DEFINITION_PATTERN = re.compile(r"^\s*([A-Za-z_]\w*)\s*\(\s*([A-Za-z_]\w*)\s*\)\s*=(?!=)(.*)$", re.DOTALL)
+_RESERVED_NAMES = {"x", *_ALLOWED_FUNCTIONS.keys(), *_ALLOWED_CONSTANTS.keys()}
+_BINOP_FUNCTIONS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Pow: operator.pow,
+}
+_DOMAIN_ERRORS = (OverflowError, ZeroDivisionError, ValueError, TypeError)
+
+SCALAR = "scalar"
+BATCH = "batch"
+INTERVAL = "interval"
+_CALIBRATION_PROBE = "sin(x) * exp(-x**2 / 8) + sqrt(x*x + 1) / (2 + cos(3*x))"
+_CALIBRATION_BATCH_SIZES = (1, 16, 256, 4096)
+
+
+@dataclass(frozen=True)
+class EvaluatorBackend:
+    name: str
+    capabilities: frozenset[str]
+    evaluate_batch: Callable[[CompiledExpression, Sequence[float]], list[float | None]]
+    evaluate_scalar: Callable[[CompiledExpression, float], float] | None = None
+    min_batch_size: int = 0
+
+
+_BACKENDS: dict[str, EvaluatorBackend] = {}
+_calibrated_choices: dict[int, str] = {}
 
 
-def validate_and_compile(expression_text: str) -> CompiledExpression:
+def validate_and_compile(
+    expression_text: str,
+    definitions: DefinitionRegistry | None = None,
+) -> CompiledExpression:
     text = expression_text.strip()
     if not text:
         raise ExpressionValidationError("Expression cannot be empty.")
 
-    try:
-        tree = ast.parse(text, mode="eval")
-    except SyntaxError as error:
-        raise ExpressionValidationError("Invalid expression syntax.") from error
+    tree = _parse_expression(text)
+    helpers = definitions.definitions() if definitions is not None else {}
+    _validate_ast(tree, helpers=helpers)
 
-    node_count = sum(1 for _ in ast.walk(tree))
-    if node_count > _MAX_AST_NODES:
-        raise ExpressionValidationError("Expression is too complex.")
+    used_helpers: set[str] = set()
+    if helpers:
+        budget = [_MAX_AST_NODES]
+        tree = ast.Expression(body=_inline_helpers(tree.body, helpers, {}, used_helpers, budget))
+        if sum(1 for _ in ast.walk(tree)) > _MAX_AST_NODES:
+            raise ExpressionValidationError("Expression is too complex after expanding helper functions.")
+
+    tree = ast.Expression(body=_fold_constants(tree.body))
+    return CompiledExpression(
+        expression_text=text,
+        ast_tree=tree,
+        helpers=frozenset(used_helpers),
+        fingerprint=hashlib.sha256(canonical_form(tree).encode("utf-8")).hexdigest(),
+    )
+
+
+def canonical_form(tree: ast.AST) -> str:
+    node = tree.body if isinstance(tree, ast.Expression) else tree
+    if isinstance(node, ast.Constant):
+        try:
+            return repr(float(node.value))
+        except OverflowError:
+            return repr(node.value)
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.UnaryOp):
+        operand = canonical_form(node.operand)
+        return operand if isinstance(node.op, ast.UAdd) else f"neg({operand})"
+    if isinstance(node, ast.BinOp):
+        operands = [canonical_form(node.left), canonical_form(node.right)]
+        if isinstance(node.op, (ast.Add, ast.Mult)):
+            operands.sort()
+        return f"{type(node.op).__name__.lower()}({','.join(operands)})"
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+        return f"{node.func.id}({','.join(canonical_form(argument) for argument in node.args)})"
+    raise ExpressionValidationError("Unsupported expression structure.")
 
-    _validate_ast(tree)
-    return CompiledExpression(expression_text=text, ast_tree=tree)
+
+def expanded_expression_text(compiled: CompiledExpression) -> str:
+    return ast.unparse(compiled.ast_tree)
+
+
+def is_definition(text: str) -> bool:
+    return _DEFINITION_PATTERN.match(text) is not None
+
+
+class DefinitionRegistry:
+    def __init__(self, cache_limit: int = 128) -> None:
+        self._definitions: dict[str, FunctionDefinition] = {}
+        self._compiled: dict[str, CompiledExpression] = {}
+        self._cache_limit = cache_limit
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._definitions
+
+    def definitions(self) -> dict[str, FunctionDefinition]:
+        return dict(self._definitions)
+
+    def define(self, definition_text: str) -> FunctionDefinition:
+        match = _DEFINITION_PATTERN.match(definition_text)
+        if match is None:
+            raise ExpressionValidationError("Definitions must look like name(arg) = expression.")
+
+        name, parameter, body_text = match.group(1), match.group(2), match.group(3).strip()
+        if name.startswith("__") or parameter.startswith("__"):
+            raise ExpressionValidationError("Dunder names are not allowed.")
+        if name in _RESERVED_NAMES:
+            raise ExpressionValidationError(f"Cannot redefine built-in name: {name}")
+        if parameter in _RESERVED_NAMES - {"x"} or parameter in self._definitions or parameter == name:
+            raise ExpressionValidationError(f"Invalid parameter name: {parameter}")
+        if not body_text:
+            raise ExpressionValidationError("Definition body cannot be empty.")
+
+        tree = _parse_expression(body_text)
+        helpers = {key: value for key, value in self._definitions.items() if key != name}
+        if name in _called_names(tree):
+            raise ExpressionValidationError(f"Recursive definition is not allowed: {name}")
+        _validate_ast(tree, variable=parameter, helpers=helpers)
+        called = _called_names(tree) & helpers.keys()
+        if self._reaches(called, name):
+            raise ExpressionValidationError(f"Recursive definition is not allowed: {name}")
+
+        definition = FunctionDefinition(
+            name=name,
+            parameter=parameter,
+            body_text=body_text,
+            ast_body=tree.body,
+            helpers=frozenset(called),
+        )
+        self._definitions[name] = definition
+        self._invalidate(name)
+        return definition
+
+    def remove(self, name: str) -> set[str]:
+        removed: set[str] = set()
+        pending = [name]
+        while pending:
+            current = pending.pop()
+            if self._definitions.pop(current, None) is None:
+                continue
+            removed.add(current)
+            self._invalidate(current)
+            pending.extend(other for other, definition in self._definitions.items() if current in definition.helpers)
+        return removed
+
+    def compile(self, expression_text: str) -> CompiledExpression:
+        text = expression_text.strip()
+        compiled = self._compiled.get(text)
+        if compiled is None:
+            compiled = validate_and_compile(text, definitions=self)
+            self._compiled[text] = compiled
+            while len(self._compiled) > self._cache_limit:
+                del self._compiled[next(iter(self._compiled))]
+        return compiled
+
+    def _reaches(self, start: set[str], target: str) -> bool:
+        pending = list(start)
+        seen: set[str] = set()
+        while pending:
+            current = pending.pop()
+            if current == target:
+                return True
+            if current in seen or current not in self._definitions:
+                continue
+            seen.add(current)
+            pending.extend(self._definitions[current].helpers)
+        return False
+
+    def _invalidate(self, name: str) -> None:
+        self._compiled = {
+            text: compiled for text, compiled in self._compiled.items() if name not in compiled.helpers
+        }
 
 
 def evaluate(compiled: CompiledExpression, x_value: float) -> float:
     try:
         result = _evaluate_node(compiled.ast_tree.body, float(x_value))
-    except (OverflowError, ZeroDivisionError, ValueError) as error:
+    except _DOMAIN_ERRORS as error:
         raise ExpressionDomainError("f(x) is undefined for provided x.") from error
 
+    if isinstance(result, complex):
+        raise ExpressionDomainError("f(x) is undefined for provided x.")
     if not math.isfinite(result):
         raise ExpressionDomainError("f(x) is not finite for provided x.")
     return float(result)
 
 
-def _validate_ast(tree: ast.AST) -> None:
+def evaluate_with_derivative(compiled: CompiledExpression, x_value: float) -> tuple[float, float | None]:
+    try:
+        value, derivative = _evaluate_dual(compiled.ast_tree.body, float(x_value))
+    except _DOMAIN_ERRORS as error:
+        raise ExpressionDomainError("f(x) is undefined for provided x.") from error
+
+    if isinstance(value, complex):
+        raise ExpressionDomainError("f(x) is undefined for provided x.")
+    if not math.isfinite(value):
+        raise ExpressionDomainError("f(x) is not finite for provided x.")
+    if isinstance(derivative, complex) or not math.isfinite(derivative):
+        return float(value), None
+    return float(value), float(derivative)
+
+
+def evaluate_batch_with_derivative(
+    compiled: CompiledExpression,
+    x_values: Sequence[float],
+) -> list[tuple[float | None, float | None]]:
+    results: list[tuple[float | None, float | None]] = []
+    for x_value in x_values:
+        try:
+            results.append(evaluate_with_derivative(compiled, x_value))
+        except ExpressionDomainError:
+            results.append((None, None))
+    return results
+
+
+def evaluate_batch(
+    compiled: CompiledExpression,
+    x_values: Sequence[float],
+    backend: str | None = None,
+) -> list[float | None]:
+    selected = get_backend(backend) if backend is not None else select_backend(len(x_values))
+    return selected.evaluate_batch(compiled, x_values)
+
+
+def register_backend(backend: EvaluatorBackend) -> None:
+    _BACKENDS[backend.name] = backend
+    _calibrated_choices.clear()
+
+
+def get_backend(name: str) -> EvaluatorBackend:
+    try:
+        return _BACKENDS[name]
+    except KeyError as error:
+        raise ValueError(f"Unknown evaluator backend: {name}") from error
+
+
+def available_backends(capability: str | None = None) -> list[str]:
+    return [name for name, backend in _BACKENDS.items() if capability is None or capability in backend.capabilities]
+
+
+def select_backend(batch_size: int, capability: str = BATCH) -> EvaluatorBackend:
+    if capability == BATCH and _calibrated_choices:
+        bucket = max((size for size in _calibrated_choices if size <= batch_size), default=None)
+        if bucket is not None:
+            return _BACKENDS[_calibrated_choices[bucket]]
+
+    candidates = [
+        backend
+        for backend in _BACKENDS.values()
+        if capability in backend.capabilities and backend.min_batch_size <= batch_size
+    ]
+    if not candidates:
+        raise ValueError(f"No evaluator backend supports {capability} evaluation.")
+    return max(candidates, key=lambda backend: backend.min_batch_size)
+
+
+def calibrate_backends(
+    probe_expression: str = _CALIBRATION_PROBE,
+    batch_sizes: Sequence[int] = _CALIBRATION_BATCH_SIZES,
+    repeats: int = 3,
+    clock: Callable[[], float] = time.perf_counter,
+) -> dict[int, str]:
+    compiled = validate_and_compile(probe_expression)
+    choices: dict[int, str] = {}
+    for size in batch_sizes:
+        x_values = [-10.0 + 20.0 * index / max(size - 1, 1) for index in range(size)]
+        timings: dict[str, float] = {}
+        for name in available_backends(BATCH):
+            backend = _BACKENDS[name]
+            backend.evaluate_batch(compiled, x_values)
+            best = math.inf
+            for _ in range(repeats):
+                started = clock()
+                backend.evaluate_batch(compiled, x_values)
+                best = min(best, clock() - started)
+            timings[name] = best
+        choices[size] = min(timings, key=timings.__getitem__)
+
+    _calibrated_choices.clear()
+    _calibrated_choices.update(choices)
+    return dict(choices)
+
+
+def reset_calibration() -> None:
+    _calibrated_choices.clear()
+
+
+def _parse_expression(text: str) -> ast.Expression:
+    try:
+        tree = ast.parse(text, mode="eval")
+    except SyntaxError as error:
+        raise ExpressionValidationError("Invalid expression syntax.") from error
+
+    node_count = sum(1 for _ in ast.walk(tree))
+    if node_count > _MAX_AST_NODES:
+        raise ExpressionValidationError("Expression is too complex.")
+    return tree
+
+
+def _called_names(tree: ast.AST) -> set[str]:
+    return {
+        node.func.id
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+    }
+
+
+def _validate_ast(
+    tree: ast.AST,
+    variable: str = "x",
+    helpers: Mapping[str, FunctionDefinition] | None = None,
+) -> None:
+    helpers = helpers or {}
+    allowed_names = {variable, *_ALLOWED_CONSTANTS.keys()}
+    callees = {id(node.func) for node in ast.walk(tree) if isinstance(node, ast.Call)}
     for node in ast.walk(tree):
         if not isinstance(node, _ALLOWED_AST_NODES):
             raise ExpressionValidationError("Unsupported expression construct.")
@@ -78,14 +370,18 @@ def _validate_ast(tree: ast.AST) -> None:
             if type(node.value) not in (int, float):
                 raise ExpressionValidationError("Only numeric constants are allowed.")
 
-        if isinstance(node, ast.Name):
+        if isinstance(node, ast.Name) and id(node) not in callees:
             if node.id.startswith("__"):
                 raise ExpressionValidationError("Dunder names are not allowed.")
-            if node.id not in {"x", *_ALLOWED_FUNCTIONS.keys(), *_ALLOWED_CONSTANTS.keys()}:
+            if (node.id in _ALLOWED_FUNCTIONS or node.id in helpers) and node.id not in allowed_names:
+                raise ExpressionValidationError(f"Function {node.id} must be called with an argument.")
+            if node.id not in allowed_names:
                 raise ExpressionValidationError(f"Unknown identifier: {node.id}")
 
         if isinstance(node, ast.Call):
-            if not isinstance(node.func, ast.Name) or node.func.id not in _ALLOWED_FUNCTIONS:
+            if not isinstance(node.func, ast.Name) or (
+                node.func.id not in _ALLOWED_FUNCTIONS and node.func.id not in helpers
+            ):
                 raise ExpressionValidationError("Only approved math functions are allowed.")
             if len(node.args) != 1:
                 raise ExpressionValidationError("Math functions require exactly one argument.")
@@ -93,6 +389,90 @@ def _validate_ast(tree: ast.AST) -> None:
                 raise ExpressionValidationError("Keyword arguments are not allowed.")
 
 
+def _inline_helpers(
+    node: ast.AST,
+    helpers: Mapping[str, FunctionDefinition],
+    arguments: Mapping[str, ast.AST],
+    used_helpers: set[str],
+    budget: list[int],
+) -> ast.AST:
+    budget[0] -= 1
+    if budget[0] < 0:
+        raise ExpressionValidationError("Expression is too complex after expanding helper functions.")
+
+    if isinstance(node, ast.Name):
+        if node.id in arguments:
+            argument = arguments[node.id]
+            budget[0] -= sum(1 for _ in ast.walk(argument)) - 1
+            if budget[0] < 0:
+                raise ExpressionValidationError("Expression is too complex after expanding helper functions.")
+            return argument
+        return ast.Name(id=node.id, ctx=ast.Load())
+
+    if isinstance(node, ast.Constant):
+        return ast.Constant(value=node.value)
+
+    if isinstance(node, ast.UnaryOp):
+        return ast.UnaryOp(op=node.op, operand=_inline_helpers(node.operand, helpers, arguments, used_helpers, budget))
+
+    if isinstance(node, ast.BinOp):
+        return ast.BinOp(
+            left=_inline_helpers(node.left, helpers, arguments, used_helpers, budget),
+            op=node.op,
+            right=_inline_helpers(node.right, helpers, arguments, used_helpers, budget),
+        )
+
+    if isinstance(node, ast.Call):
+        argument = _inline_helpers(node.args[0], helpers, arguments, used_helpers, budget)
+        definition = helpers.get(node.func.id)
+        if definition is None:
+            if node.func.id not in _ALLOWED_FUNCTIONS:
+                raise ExpressionValidationError("Only approved math functions are allowed.")
+            return ast.Call(func=ast.Name(id=node.func.id, ctx=ast.Load()), args=[argument], keywords=[])
+        used_helpers.add(definition.name)
+        return _inline_helpers(
+            definition.ast_body,
+            helpers,
+            {definition.parameter: argument},
+            used_helpers,
+            budget,
+        )
+
+    raise ExpressionValidationError("Unsupported expression structure.")
+
+
+def _fold_constants(node: ast.AST) -> ast.AST:
+    if isinstance(node, ast.Name) and node.id in _ALLOWED_CONSTANTS:
+        return ast.Constant(value=float(_ALLOWED_CONSTANTS[node.id]))
+
+    if isinstance(node, ast.UnaryOp):
+        node.operand = _fold_constants(node.operand)
+    elif isinstance(node, ast.BinOp):
+        node.left = _fold_constants(node.left)
+        node.right = _fold_constants(node.right)
+    elif isinstance(node, ast.Call):
+        node.args = [_fold_constants(argument) for argument in node.args]
+    else:
+        return node
+
+    if isinstance(node, ast.Call):
+        operands = node.args
+    elif isinstance(node, ast.BinOp):
+        operands = [node.left, node.right]
+    else:
+        operands = [node.operand]
+    if not all(isinstance(operand, ast.Constant) for operand in operands):
+        return node
+
+    try:
+        value = _evaluate_node(node, 0.0)
+    except _DOMAIN_ERRORS:
+        return node
+    if isinstance(value, complex) or not math.isfinite(value):
+        return node
+    return ast.Constant(value=float(value))
+
+
 def _evaluate_node(node: ast.AST, x_value: float) -> float:
     if isinstance(node, ast.Constant):
         if type(node.value) in (int, float):
@@ -136,3 +516,258 @@ def _evaluate_node(node: ast.AST, x_value: float) -> float:
         return float(function(argument))
 
     raise ExpressionValidationError("Unsupported expression structure.")
+
+
+def _evaluate_dual(node: ast.AST, x_value: float) -> tuple[float, float]:
+    if isinstance(node, ast.Constant):
+        return float(node.value), 0.0
+
+    if isinstance(node, ast.Name):
+        if node.id == "x":
+            return x_value, 1.0
+        if node.id in _ALLOWED_CONSTANTS:
+            return float(_ALLOWED_CONSTANTS[node.id]), 0.0
+        raise ExpressionValidationError(f"Unknown identifier: {node.id}")
+
+    if isinstance(node, ast.UnaryOp):
+        value, derivative = _evaluate_dual(node.operand, x_value)
+        if isinstance(node.op, ast.USub):
+            return -value, -derivative
+        return value, derivative
+
+    if isinstance(node, ast.BinOp):
+        left, d_left = _evaluate_dual(node.left, x_value)
+        right, d_right = _evaluate_dual(node.right, x_value)
+        if isinstance(node.op, ast.Add):
+            return left + right, d_left + d_right
+        if isinstance(node.op, ast.Sub):
+            return left - right, d_left - d_right
+        if isinstance(node.op, ast.Mult):
+            return left * right, d_left * right + left * d_right
+        if isinstance(node.op, ast.Div):
+            value = left / right
+            return value, _dual_rule(lambda: (d_left - value * d_right) / right)
+        if isinstance(node.op, ast.Pow):
+            value = left**right
+            if d_right == 0.0:
+                if d_left == 0.0:
+                    return value, 0.0
+                return value, _dual_rule(lambda: right * left ** (right - 1.0) * d_left)
+            return value, _dual_rule(lambda: value * (d_right * math.log(left) + right * d_left / left))
+        raise ExpressionValidationError("Unsupported binary operator.")
+
+    if isinstance(node, ast.Call):
+        argument, d_argument = _evaluate_dual(node.args[0], x_value)
+        func_name = node.func.id
+        value = float(_ALLOWED_FUNCTIONS[func_name](argument))
+        if func_name == "sin":
+            return value, math.cos(argument) * d_argument
+        if func_name == "cos":
+            return value, -math.sin(argument) * d_argument
+        if func_name == "tan":
+            return value, d_argument * (1.0 + value * value)
+        if func_name == "sqrt":
+            return value, _dual_rule(lambda: d_argument / (2.0 * value))
+        if func_name == "log":
+            return value, d_argument / argument
+        if func_name == "exp":
+            return value, value * d_argument
+        raise ExpressionValidationError("Only approved math functions are allowed.")
+
+    raise ExpressionValidationError("Unsupported expression structure.")
+
+
+def _dual_rule(rule: Callable[[], float]) -> float:
+    try:
+        result = rule()
+    except _DOMAIN_ERRORS:
+        return math.nan
+    if isinstance(result, complex):
+        return math.nan
+    return result
+
+
+def _tree_batch(compiled: CompiledExpression, x_values: Sequence[float]) -> list[float | None]:
+    results: list[float | None] = []
+    for x_value in x_values:
+        try:
+            results.append(evaluate(compiled, x_value))
+        except ExpressionDomainError:
+            results.append(None)
+    return results
+
+
+_compiled_closures: dict[str, Callable[[float], float]] = {}
+_CLOSURE_CACHE_LIMIT = 128
+
+
+def _closure_for(compiled: CompiledExpression) -> Callable[[float], float]:
+    if not compiled.fingerprint:
+        return _compile_closure(compiled.ast_tree.body)
+    function = _compiled_closures.get(compiled.fingerprint)
+    if function is None:
+        function = _compile_closure(compiled.ast_tree.body)
+        _compiled_closures[compiled.fingerprint] = function
+        while len(_compiled_closures) > _CLOSURE_CACHE_LIMIT:
+            del _compiled_closures[next(iter(_compiled_closures))]
+    return function
+
+
+def _closure_scalar(compiled: CompiledExpression, x_value: float) -> float:
+    result = _closure_batch(compiled, (x_value,))[0]
+    if result is None:
+        raise ExpressionDomainError("f(x) is undefined for provided x.")
+    return result
+
+
+def _closure_batch(compiled: CompiledExpression, x_values: Sequence[float]) -> list[float | None]:
+    function = _closure_for(compiled)
+    results: list[float | None] = []
+    for x_value in x_values:
+        try:
+            result = function(float(x_value))
+        except _DOMAIN_ERRORS:
+            results.append(None)
+            continue
+        if isinstance(result, complex) or not math.isfinite(result):
+            results.append(None)
+        else:
+            results.append(float(result))
+    return results
+
+
+def _compile_closure(node: ast.AST) -> Callable[[float], float]:
+    if isinstance(node, ast.Constant):
+        try:
+            constant = float(node.value)
+        except OverflowError:
+            return _raise_overflow
+        return lambda x_value: constant
+
+    if isinstance(node, ast.Name):
+        if node.id == "x":
+            return lambda x_value: x_value
+        constant = float(_ALLOWED_CONSTANTS[node.id])
+        return lambda x_value: constant
+
+    if isinstance(node, ast.UnaryOp):
+        operand = _compile_closure(node.operand)
+        if isinstance(node.op, ast.USub):
+            return lambda x_value: -operand(x_value)
+        return operand
+
+    if isinstance(node, ast.BinOp):
+        left = _compile_closure(node.left)
+        right = _compile_closure(node.right)
+        binop = _BINOP_FUNCTIONS[type(node.op)]
+        return lambda x_value: binop(left(x_value), right(x_value))
+
+    if isinstance(node, ast.Call):
+        function = _ALLOWED_FUNCTIONS[node.func.id]
+        argument = _compile_closure(node.args[0])
+        return lambda x_value: function(argument(x_value))
+
+    raise ExpressionValidationError("Unsupported expression structure.")
+
+
+def _raise_overflow(x_value: float) -> float:
+    raise OverflowError("Numeric constant is too large.")
+
+
+def _register_numpy_backend() -> None:
+    try:
+        import numpy
+    except ImportError:
+        return
+
+    functions = {
+        "sin": numpy.sin,
+        "cos": numpy.cos,
+        "tan": numpy.tan,
+        "sqrt": numpy.sqrt,
+        "log": numpy.log,
+        "exp": numpy.exp,
+    }
+    binops = {
+        ast.Add: numpy.add,
+        ast.Sub: numpy.subtract,
+        ast.Mult: numpy.multiply,
+        ast.Div: numpy.divide,
+        ast.Pow: numpy.power,
+    }
+
+    # Each node returns its values plus a mask of the samples where the
+    # scalar evaluator would have raised, so IEEE inf/nan that later
+    # collapse to finite numbers (1 / inf == 0) still become gaps.
+    def evaluate_array(node: ast.AST, x_array):
+        if isinstance(node, ast.Constant):
+            try:
+                return float(node.value), False
+            except OverflowError:
+                return 0.0, True
+        if isinstance(node, ast.Name):
+            return (x_array if node.id == "x" else float(_ALLOWED_CONSTANTS[node.id])), False
+        if isinstance(node, ast.UnaryOp):
+            operand, failed = evaluate_array(node.operand, x_array)
+            return (numpy.negative(operand) if isinstance(node.op, ast.USub) else operand), failed
+        if isinstance(node, ast.BinOp):
+            left, left_failed = evaluate_array(node.left, x_array)
+            right, right_failed = evaluate_array(node.right, x_array)
+            result = binops[type(node.op)](left, right)
+            failed = left_failed | right_failed
+            if isinstance(node.op, ast.Div):
+                failed = failed | (right == 0)
+            elif isinstance(node.op, ast.Pow):
+                failed = failed | ((left == 0) & (right < 0)) | raised(result, left, right)
+            return result, failed
+        if isinstance(node, ast.Call):
+            argument, failed = evaluate_array(node.args[0], x_array)
+            result = functions[node.func.id](argument)
+            return result, failed | raised(result, argument)
+        raise ExpressionValidationError("Unsupported expression structure.")
+
+    def raised(result, *operands):
+        # math and float ** raise ValueError for nan from non-nan inputs and
+        # OverflowError for inf from finite inputs.
+        defined = finite = True
+        for operand in operands:
+            defined = defined & ~numpy.isnan(operand)
+            finite = finite & numpy.isfinite(operand)
+        return (defined & numpy.isnan(result)) | (finite & numpy.isinf(result))
+
+    def numpy_batch(compiled: CompiledExpression, x_values: Sequence[float]) -> list[float | None]:
+        x_array = numpy.asarray(x_values, dtype=numpy.float64)
+        with numpy.errstate(all="ignore"):
+            values, failed = evaluate_array(compiled.ast_tree.body, x_array)
+            values = numpy.broadcast_to(values, x_array.shape)
+            failed = numpy.broadcast_to(failed, x_array.shape) | ~numpy.isfinite(values)
+        return [None if bad else float(value) for value, bad in zip(values.tolist(), failed.tolist())]
+
+    register_backend(
+        EvaluatorBackend(
+            name="numpy",
+            capabilities=frozenset({BATCH}),
+            evaluate_batch=numpy_batch,
+            min_batch_size=512,
+        )
+    )
+
+
+register_backend(
+    EvaluatorBackend(
+        name="tree",
+        capabilities=frozenset({SCALAR, BATCH}),
+        evaluate_batch=_tree_batch,
+        evaluate_scalar=evaluate,
+    )
+)
+register_backend(
+    EvaluatorBackend(
+        name="closure",
+        capabilities=frozenset({SCALAR, BATCH}),
+        evaluate_batch=_closure_batch,
+        evaluate_scalar=_closure_scalar,
+        min_batch_size=2,
+    )
+)
+_register_numpy_backend()
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import math
+import re
+from pathlib import Path
+
 from .errors import InputValidationError
 
+MAX_BATCH_VALUES = 1000
+
 
 def parse_float(value: str, field_name: str = "value") -> float:
     text = value.strip()
@@ -13,6 +19,61 @@ def parse_float(value: str, field_name: str = "value") -> float:
         raise InputValidationError(f"{field_name} must be a real number.") from error
 
 
+def parse_float_values(value: str, field_name: str = "value", max_values: int = MAX_BATCH_VALUES) -> list[float]:
+    text = value.strip()
+    if not text:
+        raise InputValidationError(f"{field_name} cannot be empty.")
+    try:
+        return [float(text)]
+    except ValueError:
+        pass
+
+    path = Path(text)
+    if path.is_file():
+        values = _read_values_file(path, field_name)
+    elif ":" in text:
+        values = _parse_range(text, field_name, max_values)
+    elif "," in text:
+        values = [parse_float(item, field_name=field_name) for item in text.split(",")]
+    else:
+        raise InputValidationError(
+            f"{field_name} must be a real number, a comma list, a start:stop:step range or a file path."
+        )
+
+    if len(values) > max_values:
+        raise InputValidationError(f"At most {max_values} {field_name} values can be evaluated at once.")
+    return values
+
+
+def _parse_range(text: str, field_name: str, max_values: int) -> list[float]:
+    parts = text.split(":")
+    if len(parts) != 3:
+        raise InputValidationError(f"{field_name} range must look like start:stop:step.")
+    start, stop, step = (parse_float(part, field_name=field_name) for part in parts)
+    if step == 0 or not math.isfinite(step):
+        raise InputValidationError(f"{field_name} range step must be a non-zero number.")
+
+    span = (stop - start) / step
+    if not math.isfinite(span) or span < 0:
+        raise InputValidationError(f"{field_name} range is empty; check the sign of the step.")
+    count = math.floor(span + 1e-9) + 1
+    if count > max_values:
+        raise InputValidationError(f"At most {max_values} {field_name} values can be evaluated at once.")
+    return [start + index * step for index in range(count)]
+
+
+def _read_values_file(path: Path, field_name: str) -> list[float]:
+    try:
+        content = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as error:
+        raise InputValidationError(f"Could not read {field_name} values from {path}.") from error
+
+    tokens = [token for token in re.split(r"[,\s]+", content) if token]
+    if not tokens:
+        raise InputValidationError(f"{path} contains no {field_name} values.")
+    return [parse_float(token, field_name=field_name) for token in tokens]
+
+
 def normalize_expression(value: str) -> str:
     text = value.strip()
     if not text:
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+from .errors import ExpressionDomainError, InputValidationError
+from .expression import evaluate_batch
+from .models import CompiledExpression, IntegralResult, PlotResult
+from .plotting import column_to_x
+
+_DEFAULT_PANELS = 8
+
+
+@dataclass
+class _Panel:
+    left: float
+    middle: float
+    right: float
+    f_left: float
+    f_middle: float
+    f_right: float
+    whole: float
+
+
+def integrate(
+    compiled: CompiledExpression,
+    lower: float,
+    upper: float,
+    tolerance: float = 1e-8,
+    max_evaluations: int = 20000,
+    plot: PlotResult | None = None,
+) -> IntegralResult:
+    if not (math.isfinite(lower) and math.isfinite(upper)):
+        raise InputValidationError("Integration bounds must be finite.")
+    if lower == upper:
+        return IntegralResult(lower, upper, 0.0, 0.0, 0, 0, True)
+    if lower > upper:
+        result = integrate(compiled, upper, lower, tolerance, max_evaluations, plot)
+        return IntegralResult(
+            lower=lower,
+            upper=upper,
+            value=-result.value,
+            error_estimate=result.error_estimate,
+            evaluations=result.evaluations,
+            reused_samples=result.reused_samples,
+            converged=result.converged,
+        )
+
+    known = _seed_from_plot(compiled, lower, upper, plot)
+    reused_samples = len(known)
+    nodes = sorted({lower, upper, *known})
+    if len(nodes) < 3:
+        step = (upper - lower) / _DEFAULT_PANELS
+        nodes = [lower + step * index for index in range(_DEFAULT_PANELS)] + [upper]
+
+    evaluations = _evaluate_missing(compiled, nodes, known)
+    midpoints = [(left + right) / 2.0 for left, right in zip(nodes, nodes[1:])]
+    evaluations += _evaluate_missing(compiled, midpoints, known)
+
+    active = [
+        _Panel(left, middle, right, known[left], known[middle], known[right], 0.0)
+        for left, middle, right in zip(nodes, midpoints, nodes[1:])
+    ]
+    for panel in active:
+        panel.whole = _simpson(panel.left, panel.right, panel.f_left, panel.f_middle, panel.f_right)
+
+    total = 0.0
+    error_estimate = 0.0
+    converged = True
+    span = upper - lower
+    while active:
+        quarters = [point for panel in active for point in _quarter_points(panel)]
+        if evaluations + len(quarters) > max_evaluations:
+            converged = False
+            for panel in active:
+                total += panel.whole
+            break
+        evaluations += _evaluate_missing(compiled, quarters, known)
+
+        refined: list[_Panel] = []
+        for panel in active:
+            left_quarter, right_quarter = _quarter_points(panel)
+            left_half = _simpson(panel.left, panel.middle, panel.f_left, known[left_quarter], panel.f_middle)
+            right_half = _simpson(panel.middle, panel.right, panel.f_middle, known[right_quarter], panel.f_right)
+            difference = left_half + right_half - panel.whole
+            panel_tolerance = tolerance * (panel.right - panel.left) / span
+            exhausted = panel.right - panel.left <= 1e-12 * span
+            if abs(difference) <= 15.0 * panel_tolerance or exhausted:
+                total += left_half + right_half + difference / 15.0
+                error_estimate += abs(difference) / 15.0
+                converged = converged and not exhausted
+                continue
+            refined.append(
+                _Panel(panel.left, left_quarter, panel.middle, panel.f_left, known[left_quarter], panel.f_middle, left_half)
+            )
+            refined.append(
+                _Panel(panel.middle, right_quarter, panel.right, panel.f_middle, known[right_quarter], panel.f_right, right_half)
+            )
+        active = refined
+
+    # Panels left unrefined contribute their coarse estimates but no error
+    # term, so a non-converged total has no meaningful error bound.
+    if not converged:
+        error_estimate = math.inf
+
+    return IntegralResult(
+        lower=lower,
+        upper=upper,
+        value=total,
+        error_estimate=error_estimate,
+        evaluations=evaluations,
+        reused_samples=reused_samples,
+        converged=converged,
+    )
+
+
+def _seed_from_plot(
+    compiled: CompiledExpression,
+    lower: float,
+    upper: float,
+    plot: PlotResult | None,
+) -> dict[float, float]:
+    if plot is None or plot.truncated or plot.expression_text != compiled.expression_text:
+        return {}
+    if len(plot.samples) != plot.config.width:
+        return {}
+
+    known: dict[float, float] = {}
+    for column, y_value in enumerate(plot.samples):
+        x_value = column_to_x(column, plot.config)
+        if not lower <= x_value <= upper:
+            continue
+        if y_value is None:
+            raise _domain_gap(x_value)
+        known[x_value] = y_value
+    return known
+
+
+def _evaluate_missing(compiled: CompiledExpression, points: list[float], known: dict[float, float]) -> int:
+    missing = [point for point in dict.fromkeys(points) if point not in known]
+    if not missing:
+        return 0
+    for x_value, y_value in zip(missing, evaluate_batch(compiled, missing)):
+        if y_value is None:
+            raise _domain_gap(x_value)
+        known[x_value] = y_value
+    return len(missing)
+
+
+def _quarter_points(panel: _Panel) -> tuple[float, float]:
+    return (panel.left + panel.middle) / 2.0, (panel.middle + panel.right) / 2.0
+
+
+def _simpson(left: float, right: float, f_left: float, f_middle: float, f_right: float) -> float:
+    return (right - left) / 6.0 * (f_left + 4.0 * f_middle + f_right)
+
+
+def _domain_gap(x_value: float) -> ExpressionDomainError:
+    return ExpressionDomainError(
+        f"f(x) is undefined at x = {x_value:.6g}; the integral does not exist over an interval with a domain gap."
+    )
@@ -1,12 +1,23 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass(frozen=True)
 class CompiledExpression:
     expression_text: str
     ast_tree: object
+    helpers: frozenset[str] = field(default_factory=frozenset)
+    fingerprint: str = ""
+
+
+@dataclass(frozen=True)
+class FunctionDefinition:
+    name: str
+    parameter: str
+    body_text: str
+    ast_body: object
+    helpers: frozenset[str] = field(default_factory=frozenset)
 
 
 @dataclass
@@ -24,6 +35,8 @@ class PlotConfig:
     y_max: float
     width: int
     height: int
+    auto_y: bool = False
+    derivative: bool = False
 
 
 @dataclass(frozen=True)
@@ -33,11 +46,37 @@ class PlotResult:
     points: set[tuple[int, int]]
     axis_row: int | None
     axis_col: int | None
-    marker: MarkedPoint | None
+    markers: tuple[MarkedPoint, ...]
     clipped_points: int
+    samples: tuple[float | None, ...] = ()
+    derivative_points: set[tuple[int, int]] = field(default_factory=set)
+    derivative_samples: tuple[float | None, ...] = ()
+    truncated: bool = False
 
 
 @dataclass(frozen=True)
 class RenderOutput:
     text: str
     metadata: dict[str, str]
+
+
+@dataclass(frozen=True)
+class WatchCycleSummary:
+    cycle: int
+    expressions: int
+    recomputed: int
+    reused: int
+    removed: int
+    failed: int
+    elapsed_ms: float
+
+
+@dataclass(frozen=True)
+class IntegralResult:
+    lower: float
+    upper: float
+    value: float
+    error_estimate: float
+    evaluations: int
+    reused_samples: int
+    converged: bool
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import atexit
+import math
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Iterable, Sequence
+
+from .expression import evaluate_batch, evaluate_batch_with_derivative
+from .models import CompiledExpression
+
+PARALLEL_MIN_SAMPLES = 20_000
+
+_FLOAT_SIZE = array("d").itemsize
+
+_WORKER_CACHE_LIMIT = 32
+
+_pool: ProcessPoolExecutor | None = None
+_pool_workers = 0
+
+_worker_expressions: dict[str, CompiledExpression] = {}
+
+
+def should_sample_in_workers(sample_count: int, workers: int, min_samples: int = PARALLEL_MIN_SAMPLES) -> bool:
+    return workers > 1 and sample_count >= max(min_samples, workers)
+
+
+def sample_in_workers(
+    compiled: CompiledExpression,
+    x_values: Sequence[float],
+    derivative: bool,
+    workers: int,
+) -> tuple[list[float | None], list[float | None]]:
+    count = len(x_values)
+    series = 2 if derivative else 1
+    chunks = _chunk_bounds(count, workers)
+    block = shared_memory.SharedMemory(create=True, size=count * (1 + series) * _FLOAT_SIZE)
+    buffer = block.buf.cast("d")
+    try:
+        buffer[:count] = array("d", x_values)
+        pool = _pool_for(len(chunks))
+        tasks = [(compiled.fingerprint, compiled, block.name, count, series, start, stop) for start, stop in chunks]
+        for _ in pool.map(_evaluate_chunk, tasks):
+            pass
+        samples = _decode(buffer[count : 2 * count])
+        derivative_samples = _decode(buffer[2 * count :]) if derivative else []
+    finally:
+        buffer.release()
+        block.close()
+        block.unlink()
+    return samples, derivative_samples
+
+
+def shutdown_workers() -> None:
+    global _pool, _pool_workers
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+    _pool = None
+    _pool_workers = 0
+
+
+# One pool serves every expression: starting processes costs far more than
+# shipping a compiled expression with each task, so the pool is only
+# replaced when the worker count changes.
+def _pool_for(workers: int) -> ProcessPoolExecutor:
+    global _pool, _pool_workers
+    if _pool is not None and _pool_workers == workers:
+        return _pool
+
+    shutdown_workers()
+    _pool = ProcessPoolExecutor(max_workers=workers)
+    _pool_workers = workers
+    return _pool
+
+
+def _chunk_bounds(count: int, workers: int) -> list[tuple[int, int]]:
+    chunk_count = max(1, min(workers, count))
+    size, remainder = divmod(count, chunk_count)
+    bounds: list[tuple[int, int]] = []
+    start = 0
+    for index in range(chunk_count):
+        stop = start + size + (1 if index < remainder else 0)
+        bounds.append((start, stop))
+        start = stop
+    return bounds
+
+
+def _decode(values: memoryview) -> list[float | None]:
+    return [None if math.isnan(value) else value for value in values.tolist()]
+
+
+def _worker_expression(fingerprint: str, compiled: CompiledExpression) -> CompiledExpression:
+    cached = _worker_expressions.get(fingerprint)
+    if cached is not None:
+        return cached
+    if len(_worker_expressions) >= _WORKER_CACHE_LIMIT:
+        del _worker_expressions[next(iter(_worker_expressions))]
+    _worker_expressions[fingerprint] = compiled
+    return compiled
+
+
+def _evaluate_chunk(task: tuple[str, CompiledExpression, str, int, int, int, int]) -> None:
+    fingerprint, compiled, name, count, series, start, stop = task
+    compiled = _worker_expression(fingerprint, compiled)
+
+    block = shared_memory.SharedMemory(name=name)
+    buffer = block.buf.cast("d")
+    try:
+        x_values = buffer[start:stop].tolist()
+        if series == 1:
+            samples = evaluate_batch(compiled, x_values)
+            buffer[count + start : count + stop] = _encode(samples)
+        else:
+            pairs = evaluate_batch_with_derivative(compiled, x_values)
+            buffer[count + start : count + stop] = _encode(value for value, _ in pairs)
+            buffer[2 * count + start : 2 * count + stop] = _encode(slope for _, slope in pairs)
+    finally:
+        buffer.release()
+        block.close()
+
+
+def _encode(values: Iterable[float | None]) -> array:
+    return array("d", (math.nan if value is None else value for value in values))
+
+
+atexit.register(shutdown_workers)
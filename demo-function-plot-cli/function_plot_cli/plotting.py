@@ -1,62 +1,236 @@
 from __future__ import annotations
 
-from .expression import evaluate
+import math
+from dataclasses import replace
+from typing import Iterator, Sequence
+
+from .budget import BudgetMeter, CancellationToken, EvaluationBudget
+from .expression import evaluate_batch, evaluate_batch_with_derivative
 from .models import CompiledExpression, MarkedPoint, PlotConfig, PlotResult
+from .parallel import sample_in_workers, should_sample_in_workers
 
 
 def build_plot(
     compiled: CompiledExpression,
     config: PlotConfig,
-    marker: MarkedPoint | None = None,
+    markers: Sequence[MarkedPoint] = (),
+    budget: EvaluationBudget | None = None,
+    cancel_token: CancellationToken | None = None,
+    workers: int = 1,
 ) -> PlotResult:
-    points: set[tuple[int, int]] = set()
-    clipped_points = 0
+    x_values = [column_to_x(column, config) for column in range(config.width)]
+    truncated = False
+    if budget is None and cancel_token is None:
+        samples, derivative_samples = _sample(compiled, x_values, config.derivative, workers)
+    else:
+        samples, derivative_samples, truncated = _sample_with_budget(
+            compiled,
+            x_values,
+            config.derivative,
+            BudgetMeter(budget, cancel_token),
+        )
+    return _assemble(compiled, config, samples, derivative_samples, markers, truncated)
 
-    for column in range(config.width):
-        x_value = _column_to_x(column, config)
-        try:
-            y_value = evaluate(compiled, x_value)
-        except Exception:
-            continue
 
-        if y_value < config.y_min or y_value > config.y_max:
-            clipped_points += 1
-            continue
+def build_plot_progressive(
+    compiled: CompiledExpression,
+    config: PlotConfig,
+    markers: Sequence[MarkedPoint] = (),
+    budget: EvaluationBudget | None = None,
+    cancel_token: CancellationToken | None = None,
+    workers: int = 1,
+    stride: int = 8,
+) -> Iterator[PlotResult]:
+    x_values = [column_to_x(column, config) for column in range(config.width)]
+    samples: list[float | None] = [None] * config.width
+    derivative_samples: list[float | None] = [None] * config.width if config.derivative else []
+    meter = None if budget is None and cancel_token is None else BudgetMeter(budget, cancel_token)
+
+    for columns in _refinement_passes(config.width, stride):
+        pass_x_values = [x_values[column] for column in columns]
+        truncated = False
+        if meter is None:
+            pass_samples, pass_derivatives = _sample(compiled, pass_x_values, config.derivative, workers)
+        else:
+            pass_samples, pass_derivatives, truncated = _sample_with_budget(
+                compiled,
+                pass_x_values,
+                config.derivative,
+                meter,
+            )
+        for column, value in zip(columns, pass_samples):
+            samples[column] = value
+        for column, slope in zip(columns, pass_derivatives):
+            derivative_samples[column] = slope
+
+        yield _assemble(compiled, config, samples, derivative_samples, markers, truncated)
+        if truncated:
+            return
 
-        row = _y_to_row(y_value, config)
-        points.add((row, column))
+
+def with_markers(plot: PlotResult, markers: Sequence[MarkedPoint]) -> PlotResult:
+    return replace(plot, markers=_resolve_markers(markers, plot.config))
+
+
+def _assemble(
+    compiled: CompiledExpression,
+    config: PlotConfig,
+    samples: Sequence[float | None],
+    derivative_samples: Sequence[float | None],
+    markers: Sequence[MarkedPoint],
+    truncated: bool,
+) -> PlotResult:
+    if config.auto_y:
+        y_min, y_max = robust_y_range([*samples, *derivative_samples], config.y_min, config.y_max)
+        config = replace(config, y_min=y_min, y_max=y_max)
+
+    points, clipped_points = _map_samples(samples, config)
+    derivative_points, _ = _map_samples(derivative_samples, config)
 
     axis_col = _axis_col(config)
     axis_row = _axis_row(config)
 
-    resolved_marker = None
-    if marker is not None:
-        visible = (
-            config.x_min <= marker.x <= config.x_max
-            and config.y_min <= marker.y <= config.y_max
-        )
-        resolved_marker = MarkedPoint(x=marker.x, y=marker.y, visible=visible)
-
     return PlotResult(
         expression_text=compiled.expression_text,
         config=config,
         points=points,
         axis_row=axis_row,
         axis_col=axis_col,
-        marker=resolved_marker,
+        markers=_resolve_markers(markers, config),
         clipped_points=clipped_points,
+        samples=tuple(samples),
+        derivative_points=derivative_points,
+        derivative_samples=tuple(derivative_samples),
+        truncated=truncated,
     )
 
 
-def marker_cell(plot: PlotResult) -> tuple[int, int] | None:
-    if not plot.marker or not plot.marker.visible:
-        return None
-    row = _y_to_row(plot.marker.y, plot.config)
-    col = _x_to_column(plot.marker.x, plot.config)
-    return row, col
+def _resolve_markers(markers: Sequence[MarkedPoint], config: PlotConfig) -> tuple[MarkedPoint, ...]:
+    return tuple(
+        MarkedPoint(
+            x=marker.x,
+            y=marker.y,
+            visible=config.x_min <= marker.x <= config.x_max and config.y_min <= marker.y <= config.y_max,
+        )
+        for marker in markers
+    )
+
+
+def robust_y_range(
+    samples: Sequence[float | None],
+    fallback_min: float,
+    fallback_max: float,
+    trim: float = 0.05,
+    padding: float = 0.05,
+    outlier_factor: float = 2.0,
+) -> tuple[float, float]:
+    values = sorted(value for value in samples if value is not None)
+    if not values:
+        return fallback_min, fallback_max
+
+    low = _percentile(values, trim)
+    high = _percentile(values, 1.0 - trim)
+    # A tail is only trimmed when it reaches further past the trimmed range
+    # than outlier_factor times that range, as near an asymptote.
+    reach = outlier_factor * (high - low)
+    if low - values[0] <= reach:
+        low = values[0]
+    if values[-1] - high <= reach:
+        high = values[-1]
+    if high - low <= 1e-12 * max(1.0, abs(low), abs(high)):
+        return low - 1.0, high + 1.0
+    margin = (high - low) * padding
+    return low - margin, high + margin
+
+
+def marker_cells(plot: PlotResult) -> list[tuple[int, int]]:
+    return [
+        (_y_to_row(marker.y, plot.config), _x_to_column(marker.x, plot.config))
+        for marker in plot.markers
+        if marker.visible
+    ]
+
+
+def _refinement_passes(width: int, stride: int) -> Iterator[list[int]]:
+    step = max(1, stride)
+    columns = list(range(0, width, step))
+    if columns and columns[-1] != width - 1:
+        columns.append(width - 1)
+    yield columns
+
+    seen = set(columns)
+    while step > 1:
+        step //= 2
+        columns = [column for column in range(0, width, step) if column not in seen]
+        if columns:
+            seen.update(columns)
+            yield columns
+
+
+def _sample(
+    compiled: CompiledExpression,
+    x_values: Sequence[float],
+    derivative: bool,
+    workers: int = 1,
+) -> tuple[list[float | None], list[float | None]]:
+    if should_sample_in_workers(len(x_values), workers):
+        return sample_in_workers(compiled, x_values, derivative, workers)
+    if not derivative:
+        return evaluate_batch(compiled, x_values), []
+    pairs = evaluate_batch_with_derivative(compiled, x_values)
+    return [value for value, _ in pairs], [slope for _, slope in pairs]
+
+
+def _sample_with_budget(
+    compiled: CompiledExpression,
+    x_values: Sequence[float],
+    derivative: bool,
+    meter: BudgetMeter,
+) -> tuple[list[float | None], list[float | None], bool]:
+    samples: list[float | None] = []
+    derivative_samples: list[float | None] = []
+    while len(samples) < len(x_values):
+        allowance = meter.allowance()
+        if allowance == 0:
+            missing = len(x_values) - len(samples)
+            samples.extend([None] * missing)
+            if derivative:
+                derivative_samples.extend([None] * missing)
+            return samples, derivative_samples, True
+
+        chunk = x_values[len(samples) : len(samples) + allowance]
+        chunk_samples, chunk_derivatives = _sample(compiled, chunk, derivative)
+        samples.extend(chunk_samples)
+        derivative_samples.extend(chunk_derivatives)
+        meter.evaluations += len(chunk)
+    return samples, derivative_samples, False
+
+
+def _map_samples(samples: Sequence[float | None], config: PlotConfig) -> tuple[set[tuple[int, int]], int]:
+    points: set[tuple[int, int]] = set()
+    clipped_points = 0
+    for column, y_value in enumerate(samples):
+        if y_value is None:
+            continue
+
+        if y_value < config.y_min or y_value > config.y_max:
+            clipped_points += 1
+            continue
+
+        row = _y_to_row(y_value, config)
+        points.add((row, column))
+    return points, clipped_points
+
+
+def _percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    position = fraction * (len(sorted_values) - 1)
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    weight = position - lower
+    return sorted_values[lower] * (1.0 - weight) + sorted_values[upper] * weight
 
 
-def _column_to_x(column: int, config: PlotConfig) -> float:
+def column_to_x(column: int, config: PlotConfig) -> float:
     if config.width <= 1:
         return config.x_min
     ratio = column / (config.width - 1)
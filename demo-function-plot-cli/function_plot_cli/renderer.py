@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from typing import Iterator, Sequence
+
+from .canvas import BitCanvas, layer_table
 from .models import PlotResult, RenderOutput
-from .plotting import marker_cell
+from .plotting import marker_cells
 
 
-_UNICODE_SYMBOLS = {
+UNICODE_SYMBOLS = {
     "frame_h": "─",
     "frame_v": "│",
     "tl": "┌",
@@ -15,10 +18,13 @@ _UNICODE_SYMBOLS = {
     "axis_v": "│",
     "axis_c": "┼",
     "curve": "•",
+    "derivative": "·",
     "marker": "◆",
 }
 
-_ASCII_SYMBOLS = {
+_LAYERS = ("axis_h", "axis_v", "derivative", "curve", "marker")
+
+ASCII_SYMBOLS = {
     "frame_h": "-",
     "frame_v": "|",
     "tl": "+",
@@ -29,75 +35,109 @@ _ASCII_SYMBOLS = {
     "axis_v": "|",
     "axis_c": "+",
     "curve": "*",
+    "derivative": ".",
     "marker": "o",
 }
 
 
-def render(plot: PlotResult, unicode_mode: bool = True) -> RenderOutput:
-    symbols = _UNICODE_SYMBOLS if unicode_mode else _ASCII_SYMBOLS
-    grid = [[" " for _ in range(plot.config.width)] for _ in range(plot.config.height)]
-
-    if plot.axis_row is not None:
-        for col in range(plot.config.width):
-            grid[plot.axis_row][col] = symbols["axis_h"]
-
-    if plot.axis_col is not None:
-        for row in range(plot.config.height):
-            grid[row][plot.axis_col] = symbols["axis_v"]
-
-    if plot.axis_row is not None and plot.axis_col is not None:
-        grid[plot.axis_row][plot.axis_col] = symbols["axis_c"]
-
-    for row, col in sorted(plot.points):
-        if 0 <= row < plot.config.height and 0 <= col < plot.config.width:
-            grid[row][col] = symbols["curve"]
-
-    marker_position = marker_cell(plot)
-    if marker_position is not None:
-        row, col = marker_position
-        if 0 <= row < plot.config.height and 0 <= col < plot.config.width:
-            grid[row][col] = symbols["marker"]
-
-    graph_lines = ["".join(row) for row in grid]
-    framed = _frame_lines(graph_lines, symbols)
-
-    marker_text = "none"
-    if plot.marker is not None:
-        marker_text = f"({plot.marker.x:.3f}, {plot.marker.y:.3f})"
-
-    metadata_lines = [
-        f"Function: f(x) = {plot.expression_text}",
-        f"Range: x:[{plot.config.x_min:g},{plot.config.x_max:g}] y:[{plot.config.y_min:g},{plot.config.y_max:g}]",
-        f"Marker: {marker_text}",
-        f"Render mode: {'unicode' if unicode_mode else 'ascii'}",
-    ]
-
-    if plot.clipped_points:
-        metadata_lines.append(f"Warning: clipped samples = {plot.clipped_points}")
-
-    output_text = "\n".join([
-        f"Plot Function: f(x) = {plot.expression_text}",
-        *framed,
-        *metadata_lines,
-    ])
-
+def render(plot: PlotResult, unicode_mode: bool = True, braille: bool = False) -> RenderOutput:
     return RenderOutput(
-        text=output_text,
-        metadata={
-            "function": plot.expression_text,
-            "x_range": f"[{plot.config.x_min:g},{plot.config.x_max:g}]",
-            "y_range": f"[{plot.config.y_min:g},{plot.config.y_max:g}]",
-            "marker": marker_text,
-            "render_mode": "unicode" if unicode_mode else "ascii",
-        },
+        text="\n".join(render_lines(plot, unicode_mode=unicode_mode, braille=braille)),
+        metadata=render_metadata(plot, unicode_mode=unicode_mode, braille=braille),
     )
 
 
-def _frame_lines(lines: list[str], symbols: dict[str, str]) -> list[str]:
-    if not lines:
-        return []
-    width = len(lines[0])
-    top = symbols["tl"] + symbols["frame_h"] * width + symbols["tr"]
-    bottom = symbols["bl"] + symbols["frame_h"] * width + symbols["br"]
-    body = [f"{symbols['frame_v']}{line}{symbols['frame_v']}" for line in lines]
-    return [top, *body, bottom]
+def render_lines(plot: PlotResult, unicode_mode: bool = True, braille: bool = False) -> Iterator[str]:
+    symbols = UNICODE_SYMBOLS if unicode_mode else ASCII_SYMBOLS
+    braille = braille and unicode_mode
+    width = (plot.config.width + 1) // 2 if braille else plot.config.width
+
+    yield f"Plot Function: f(x) = {plot.expression_text}"
+    if plot.config.height > 0:
+        yield symbols["tl"] + symbols["frame_h"] * width + symbols["tr"]
+        rows = _braille_rows(plot, symbols) if braille else _graph_rows(plot, symbols)
+        for row in rows:
+            yield symbols["frame_v"] + row + symbols["frame_v"]
+        yield symbols["bl"] + symbols["frame_h"] * width + symbols["br"]
+    yield from _metadata_lines(plot, _render_mode(unicode_mode, braille))
+
+
+def render_metadata(plot: PlotResult, unicode_mode: bool = True, braille: bool = False) -> dict[str, str]:
+    return {
+        "function": plot.expression_text,
+        "x_range": f"[{plot.config.x_min:g},{plot.config.x_max:g}]",
+        "y_range": f"[{plot.config.y_min:g},{plot.config.y_max:g}]",
+        "marker": _marker_text(plot),
+        "render_mode": _render_mode(unicode_mode, braille),
+        "y_range_mode": "auto" if plot.config.auto_y else "fixed",
+        "derivative": "on" if plot.config.derivative else "off",
+        "truncated": "yes" if plot.truncated else "no",
+    }
+
+
+def _render_mode(unicode_mode: bool, braille: bool) -> str:
+    if not unicode_mode:
+        return "ascii"
+    return "braille" if braille else "unicode"
+
+
+def _graph_rows(plot: PlotResult, symbols: dict[str, str]) -> Iterator[str]:
+    table = layer_table(_LAYERS, symbols)
+    for code, cell in table.items():
+        if cell == symbols["axis_v"] and code & 1:
+            table[code] = symbols["axis_c"]
+    yield from _plot_canvas(plot, _LAYERS).encode_cells(table)
+
+
+def _braille_rows(plot: PlotResult, symbols: dict[str, str]) -> Iterator[str]:
+    marker_columns_by_band: dict[int, set[int]] = {}
+    for row, col in marker_cells(plot):
+        marker_columns_by_band.setdefault(row // 4, set()).add(col // 2)
+    for index, line in enumerate(_plot_canvas(plot, _LAYERS[:-1]).encode_braille()):
+        marker_columns = marker_columns_by_band.get(index)
+        if marker_columns:
+            line = "".join(symbols["marker"] if col in marker_columns else cell for col, cell in enumerate(line))
+        yield line
+
+
+def _plot_canvas(plot: PlotResult, layers: Sequence[str]) -> BitCanvas:
+    canvas = BitCanvas(plot.config.width, plot.config.height, layers)
+    if plot.axis_row is not None:
+        canvas.fill_row("axis_h", plot.axis_row)
+    if plot.axis_col is not None:
+        canvas.fill_column("axis_v", plot.axis_col)
+    for row, col in plot.derivative_points:
+        canvas.set("derivative", col, row)
+    for row, col in plot.points:
+        canvas.set("curve", col, row)
+    if "marker" in layers:
+        for row, col in marker_cells(plot):
+            canvas.set("marker", col, row)
+    return canvas
+
+
+def _metadata_lines(plot: PlotResult, render_mode: str) -> Iterator[str]:
+    yield f"Function: f(x) = {plot.expression_text}"
+    yield (
+        f"Range: x:[{plot.config.x_min:g},{plot.config.x_max:g}] "
+        f"y:[{plot.config.y_min:g},{plot.config.y_max:g}]"
+        f"{' (auto y)' if plot.config.auto_y else ''}"
+    )
+    if plot.config.derivative:
+        symbols = ASCII_SYMBOLS if render_mode == "ascii" else UNICODE_SYMBOLS
+        yield f"Derivative: f'(x) drawn with '{symbols['derivative']}'"
+    yield f"Marker: {_marker_text(plot)}"
+    yield f"Render mode: {render_mode}"
+    if plot.clipped_points:
+        yield f"Warning: clipped samples = {plot.clipped_points}"
+    if plot.truncated:
+        yield "Warning: sampling stopped early; the plot is incomplete"
+
+
+def _marker_text(plot: PlotResult) -> str:
+    if not plot.markers:
+        return "none"
+    if len(plot.markers) == 1:
+        return f"({plot.markers[0].x:.3f}, {plot.markers[0].y:.3f})"
+    visible = sum(1 for marker in plot.markers if marker.visible)
+    return f"{len(plot.markers)} points ({visible} visible)"
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import json
+import math
+import tempfile
+import time
+from contextlib import nullcontext
+from dataclasses import asdict
+from pathlib import Path
+from typing import Callable, Sequence
+
+from .cli import main
+from .config import AppConfig
+from .errors import InputValidationError
+
+DEFAULT_SCRIPT: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("plot", ("1", "sin(x) * exp(-x**2 / 20)")),
+    ("mark", ("2", "1.5")),
+    ("recents", ("3", "1")),
+    ("export", ("4", "{export_path}")),
+)
+_MENU_PROMPT = "Select option"
+
+
+def replay_session(
+    script: Sequence[tuple[str, Sequence[str]]] = DEFAULT_SCRIPT,
+    repeat: int = 10,
+    config: AppConfig | None = None,
+    work_dir: Path | None = None,
+    clock: Callable[[], float] = time.perf_counter,
+) -> dict[str, object]:
+    if repeat < 1:
+        raise InputValidationError("repeat must be at least 1.")
+    app_config = config or AppConfig(unicode_mode=False)
+
+    scratch = nullcontext(str(work_dir)) if work_dir else tempfile.TemporaryDirectory(prefix="function-plot-replay-")
+    with scratch as temp_dir:
+        root = Path(temp_dir)
+        placeholders = {"export_path": str(root / "replay-export.txt")}
+        steps = [
+            (action, [value.format(**placeholders) for value in inputs])
+            for _ in range(repeat)
+            for action, inputs in script
+        ]
+        feed = [value for _, inputs in steps for value in inputs] + ["5"]
+        action_names = iter(action for action, _ in steps)
+
+        latencies: dict[str, list[float]] = {}
+        output_bytes: dict[str, int] = {}
+        state: dict[str, object] = {"action": None, "started": 0.0}
+        position = iter(feed)
+
+        def finish_action() -> None:
+            action = state["action"]
+            if action is not None:
+                latencies.setdefault(action, []).append((clock() - state["started"]) * 1000.0)
+                state["action"] = None
+
+        def scripted_input(prompt: str) -> str:
+            is_menu = prompt.startswith(_MENU_PROMPT)
+            if is_menu:
+                finish_action()
+            value = next(position, "5")
+            if is_menu and value != "5":
+                state["action"] = next(action_names)
+                state["started"] = clock()
+            return value
+
+        def counting_output(text: str) -> None:
+            action = state["action"] or "menu"
+            output_bytes[action] = output_bytes.get(action, 0) + len(text.encode("utf-8")) + 1
+
+        started = clock()
+        main(
+            input_fn=scripted_input,
+            output_fn=counting_output,
+            config=app_config,
+            recents_path=root / "recents.json",
+            cache_dir=root / "cache",
+        )
+        total_ms = (clock() - started) * 1000.0
+
+    # The first repeat runs against an empty render cache; every later one
+    # replays the same functions and mostly measures cache hits, so the
+    # percentiles only cover those warm repeats and the cold pass is
+    # reported on its own.
+    return {
+        "repeat": repeat,
+        "config": asdict(app_config),
+        "total_ms": total_ms,
+        "output_bytes": sum(output_bytes.values()),
+        "actions": {
+            action: {
+                "count": len(samples),
+                "cold_ms": samples[0],
+                "warm_count": len(samples) - 1,
+                "p50_ms": _percentile(samples[1:], 0.50),
+                "p95_ms": _percentile(samples[1:], 0.95),
+                "p99_ms": _percentile(samples[1:], 0.99),
+                "output_bytes": output_bytes.get(action, 0),
+            }
+            for action, samples in latencies.items()
+        },
+    }
+
+
+def load_script(path: Path) -> list[tuple[str, list[str]]]:
+    try:
+        content = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError) as error:
+        raise InputValidationError(f"Cannot read replay script {path}.") from error
+
+    if not isinstance(content, list):
+        raise InputValidationError("Replay script must be a JSON list of steps.")
+    script: list[tuple[str, list[str]]] = []
+    for step in content:
+        if not isinstance(step, dict) or not isinstance(step.get("action"), str):
+            raise InputValidationError("Each replay step needs an action name and inputs.")
+        inputs = step.get("inputs")
+        if not isinstance(inputs, list) or not inputs or not all(isinstance(value, str) for value in inputs):
+            raise InputValidationError("Each replay step needs an action name and inputs.")
+        script.append((step["action"], inputs))
+    return script
+
+
+def _percentile(samples: Sequence[float], fraction: float) -> float | None:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = max(math.ceil(fraction * len(ordered)) - 1, 0)
+    return ordered[rank]
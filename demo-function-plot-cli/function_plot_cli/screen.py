@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import shutil
+from typing import Callable, Sequence
+
+_CSI = "\x1b["
+
+MENU_REGION = "menu"
+PLOT_REGION = "plot"
+MESSAGES_REGION = "messages"
+
+
+class AnsiScreen:
+    def __init__(
+        self,
+        write: Callable[[str], None],
+        regions: Sequence[str] = (MENU_REGION, PLOT_REGION, MESSAGES_REGION),
+        size: Callable[[], tuple[int, int]] = shutil.get_terminal_size,
+    ) -> None:
+        self._write = write
+        self._regions: dict[str, list[str]] = {name: [] for name in regions}
+        self._compact: dict[str, list[str]] = {}
+        self._size = size
+        self._displayed: list[str] = []
+        self._displayed_size: tuple[int, int] | None = None
+        self._initialized = False
+
+    @property
+    def columns(self) -> int:
+        return max(1, self._size()[0])
+
+    @property
+    def rows(self) -> int:
+        return max(1, self._size()[1])
+
+    def invalidate(self) -> None:
+        self._initialized = False
+
+    def set_region(self, name: str, text: str, compact: str | None = None) -> None:
+        self._regions[name] = text.split("\n") if text else []
+        if compact is None:
+            self._compact.pop(name, None)
+        else:
+            self._compact[name] = compact.split("\n")
+
+    def append(self, name: str, text: str) -> None:
+        self._regions[name].extend(text.split("\n"))
+
+    def clear_region(self, name: str) -> None:
+        self._regions[name] = []
+
+    def refresh(self) -> int:
+        columns, rows = self._size()
+        frame = [line[: max(1, columns)] for line in self._fit(max(1, rows - 2))]
+        chunks: list[str] = []
+        if not self._initialized or self._displayed_size != (columns, rows):
+            chunks.append(f"{_CSI}2J")
+            self._displayed = []
+            self._displayed_size = (columns, rows)
+            self._initialized = True
+
+        for index, line in enumerate(frame):
+            previous = self._displayed[index] if index < len(self._displayed) else None
+            if previous != line:
+                chunks.append(_line_update(index + 1, previous, line))
+
+        for index in range(len(frame), len(self._displayed)):
+            chunks.append(f"{_CSI}{index + 1};1H{_CSI}2K")
+
+        chunks.append(f"{_CSI}{len(frame) + 1};1H{_CSI}J")
+        self._displayed = frame
+        payload = "".join(chunks)
+        self._write(payload)
+        return len(payload)
+
+    # The frame, the prompt row and the row the cursor moves to after Enter
+    # must fit on screen: anything taller scrolls the terminal and every
+    # later cursor-addressed update lands on the wrong row. Regions with a
+    # compact form switch to it first, then the last region (messages) drops
+    # its oldest lines; only then does the longest region lose its tail.
+    def _fit(self, limit: int) -> list[str]:
+        regions = {name: list(lines) for name, lines in self._regions.items()}
+
+        def height() -> int:
+            return sum(len(lines) for lines in regions.values())
+
+        if height() > limit:
+            regions.update({name: list(lines) for name, lines in self._compact.items() if name in regions})
+        last = next(reversed(regions), None)
+        while height() > limit and last is not None and len(regions[last]) > 1:
+            del regions[last][0]
+        while height() > limit:
+            name = max(regions, key=lambda region: len(regions[region]))
+            del regions[name][-1]
+        return [line for lines in regions.values() for line in lines]
+
+
+def _line_update(row: int, previous: str | None, line: str) -> str:
+    if previous is None:
+        return f"{_CSI}{row};1H{line}{_CSI}K"
+
+    prefix = 0
+    limit = min(len(previous), len(line))
+    while prefix < limit and previous[prefix] == line[prefix]:
+        prefix += 1
+
+    if len(previous) != len(line):
+        return f"{_CSI}{row};{prefix + 1}H{line[prefix:]}{_CSI}K"
+
+    end = len(line)
+    while end > prefix and previous[end - 1] == line[end - 1]:
+        end -= 1
+    return f"{_CSI}{row};{prefix + 1}H{line[prefix:end]}"
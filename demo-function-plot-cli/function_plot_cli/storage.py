@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import tempfile
 from pathlib import Path
+from typing import Callable
 
 from .errors import StorageError
 
@@ -27,23 +28,36 @@ def load_recent_functions(path: Path) -> list[str]:
     return result[:10]
 
 
-def save_recent_function(path: Path, expression_text: str, max_items: int = 10) -> list[str]:
+def save_recent_function(
+    path: Path,
+    expression_text: str,
+    max_items: int = 10,
+    key: Callable[[str], object] | None = None,
+) -> list[str]:
     expression = expression_text.strip()
     if not expression:
         return load_recent_functions(path)
 
-    recents = [entry for entry in load_recent_functions(path) if entry != expression]
+    if key is None:
+        recents = [entry for entry in load_recent_functions(path) if entry != expression]
+    else:
+        expression_key = key(expression)
+        recents = [entry for entry in load_recent_functions(path) if key(entry) != expression_key]
     recents.insert(0, expression)
     recents = recents[:max_items]
-    _atomic_write_json(path, recents)
+    atomic_write_json(path, recents)
     return recents
 
 
 def clear_recent_functions(path: Path) -> None:
-    _atomic_write_json(path, [])
+    atomic_write_json(path, [])
 
 
-def _atomic_write_json(path: Path, content: list[str]) -> None:
+def atomic_write_json(
+    path: Path,
+    content: object,
+    error_message: str = "Could not persist recent plots.",
+) -> None:
     temp_path: Path | None = None
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -58,4 +72,4 @@ def _atomic_write_json(path: Path, content: list[str]) -> None:
                 temp_path.unlink(missing_ok=True)
             except OSError:
                 pass
-        raise StorageError("Could not persist recent plots.") from error
+        raise StorageError(error_message) from error
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Sequence
+
 
 def format_status(level: str, message: str) -> str:
     normalized = level.upper()
@@ -8,6 +10,22 @@ def format_status(level: str, message: str) -> str:
     return f"[{normalized}] {message}"
 
 
+def format_evaluation_table(
+    x_values: Sequence[float],
+    y_values: Sequence[float | None],
+    slopes: Sequence[float | None] | None = None,
+) -> str:
+    columns = ["x", "f(x)"] if slopes is None else ["x", "f(x)", "f'(x)"]
+    header = " | ".join(f"{column:>12}" for column in columns)
+    lines = [header, "-" * len(header)]
+    for index, (x_value, y_value) in enumerate(zip(x_values, y_values)):
+        cells = [f"{x_value:.3f}", "domain error" if y_value is None else f"{y_value:.3f}"]
+        if slopes is not None:
+            cells.append("undefined" if slopes[index] is None else f"{slopes[index]:.3f}")
+        lines.append(" | ".join(f"{cell:>12}" for cell in cells))
+    return "\n".join(lines)
+
+
 def build_main_menu(active_function: str | None, recents_count: int) -> str:
     active = active_function if active_function else "None"
     lines = [
@@ -21,9 +39,15 @@ def build_main_menu(active_function: str | None, recents_count: int) -> str:
         "| 2) Evaluate y for x and mark point                                             |",
         "| 3) Show recent plots                                                           |",
         "| 4) Export current plot to file                                                 |",
+        "| 6) Integrate f(x) over [a, b]                                                  |",
         "| 5) Exit                                                                        |",
         "+--------------------------------------------------------------------------------+",
-        "| [1-5] Select   [Q] Exit                                                        |",
+        "| [1-6] Select   [Q] Exit                                                        |",
         "+--------------------------------------------------------------------------------+",
     ]
     return "\n".join(lines)
+
+
+def build_status_line(active_function: str | None) -> str:
+    active = active_function if active_function else "None"
+    return f"[1] Plot [2] Mark [3] Recents [4] Export [6] Integrate [5/Q] Exit | Active: {active}"
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import Callable
+
+from .budget import EvaluationBudget
+from .config import AppConfig
+from .errors import ExpressionValidationError, InputValidationError
+from .expression import DefinitionRegistry, is_definition
+from .input_parser import normalize_expression
+from .models import PlotConfig, PlotResult, RenderOutput, WatchCycleSummary
+from .plotting import build_plot
+from .renderer import render
+from .ui import format_status
+
+
+class WatchSession:
+    def __init__(
+        self,
+        plot_config: PlotConfig,
+        unicode_mode: bool = True,
+        clock: Callable[[], float] = time.perf_counter,
+        budget: EvaluationBudget | None = None,
+        braille: bool = False,
+    ) -> None:
+        self._plot_config = plot_config
+        self._unicode_mode = unicode_mode
+        self._budget = budget
+        self._braille = braille
+        self._clock = clock
+        self._definitions = DefinitionRegistry()
+        self._definition_names: dict[str, str] = {}
+        self._results: dict[str, tuple[frozenset[str], RenderOutput | str, str]] = {}
+        self._plots: dict[str, PlotResult] = {}
+        self._cycle = 0
+
+    def refresh(
+        self,
+        text: str,
+        output_fn: Callable[[str], None] = print,
+    ) -> WatchCycleSummary:
+        started = self._clock()
+        self._cycle += 1
+        lines = _expression_lines(text)
+        expressions = [(line_number, line) for line_number, line in lines if not is_definition(line)]
+        definitions = [(line_number, line) for line_number, line in lines if is_definition(line)]
+        failed = self._update_definitions(definitions, output_fn)
+
+        results: dict[str, tuple[frozenset[str], RenderOutput | str, str]] = {}
+        recomputed = 0
+        for line_number, expression_text in expressions:
+            entry = results.get(expression_text) or self._results.get(expression_text)
+            if entry is None:
+                entry, evaluated = self._plot(expression_text)
+                recomputed += evaluated
+                result = entry[1]
+                if isinstance(result, str):
+                    output_fn(format_status("error", f"Line {line_number}: {result}"))
+                else:
+                    output_fn(f"Line {line_number}:")
+                    output_fn(result.text)
+            if isinstance(entry[1], str):
+                failed += 1
+            results[expression_text] = entry
+
+        removed = sum(1 for expression_text in self._results if expression_text not in results)
+        self._results = {
+            expression_text: entry
+            for expression_text, entry in results.items()
+            if isinstance(entry[1], str) or entry[1].metadata.get("truncated") != "yes"
+        }
+        live = {fingerprint for _, _, fingerprint in results.values()}
+        self._plots = {fingerprint: plot for fingerprint, plot in self._plots.items() if fingerprint in live}
+        summary = WatchCycleSummary(
+            cycle=self._cycle,
+            expressions=len(expressions),
+            recomputed=recomputed,
+            reused=len(expressions) - recomputed,
+            removed=removed,
+            failed=failed,
+            elapsed_ms=(self._clock() - started) * 1000.0,
+        )
+        output_fn(format_status("info", _summary_text(summary)))
+        return summary
+
+    def _update_definitions(
+        self,
+        definitions: list[tuple[int, str]],
+        output_fn: Callable[[str], None],
+    ) -> int:
+        kept: dict[str, str] = {}
+        changed: set[str] = set()
+        failed = 0
+        for line_number, definition_text in definitions:
+            name = self._definition_names.get(definition_text)
+            if name is None:
+                try:
+                    name = self._definitions.define(definition_text).name
+                except ExpressionValidationError as error:
+                    output_fn(format_status("error", f"Line {line_number}: {error}"))
+                    failed += 1
+                    continue
+                changed.add(name)
+            kept[definition_text] = name
+
+        for definition_text, name in self._definition_names.items():
+            if definition_text not in kept and name not in kept.values():
+                changed |= self._definitions.remove(name)
+        self._definition_names = {
+            definition_text: name for definition_text, name in kept.items() if name in self._definitions
+        }
+
+        if changed:
+            self._results = {
+                expression_text: (helpers, result, fingerprint)
+                for expression_text, (helpers, result, fingerprint) in self._results.items()
+                if not isinstance(result, str) and not helpers & changed
+            }
+        return failed
+
+    def _plot(self, expression_text: str) -> tuple[tuple[frozenset[str], RenderOutput | str, str], bool]:
+        try:
+            compiled = self._definitions.compile(normalize_expression(expression_text))
+        except (InputValidationError, ExpressionValidationError) as error:
+            return (frozenset(), str(error), ""), True
+
+        plot = self._plots.get(compiled.fingerprint)
+        evaluated = plot is None
+        if plot is None:
+            plot = build_plot(compiled, self._plot_config, budget=self._budget)
+            if not plot.truncated:
+                self._plots[compiled.fingerprint] = plot
+        else:
+            plot = replace(plot, expression_text=compiled.expression_text)
+        output = render(plot, unicode_mode=self._unicode_mode, braille=self._braille)
+        return (compiled.helpers, output, compiled.fingerprint), evaluated
+
+
+def watch_file(
+    path: Path,
+    config: AppConfig,
+    plot_config: PlotConfig,
+    output_fn: Callable[[str], None] = print,
+    poll_interval: float = 0.5,
+    debounce: float = 0.2,
+    max_cycles: int | None = None,
+    sleep_fn: Callable[[float], None] = time.sleep,
+) -> int:
+    budget = None
+    if config.plot_deadline_seconds is not None:
+        budget = EvaluationBudget(deadline_seconds=config.plot_deadline_seconds)
+    session = WatchSession(
+        plot_config,
+        unicode_mode=config.unicode_mode,
+        budget=budget,
+        braille=config.braille_mode,
+    )
+    signature = _file_signature(path)
+    if signature is None:
+        output_fn(format_status("warn", f"Waiting for {path} to be created."))
+    pending = signature is not None
+    cycles = 0
+
+    while max_cycles is None or cycles < max_cycles:
+        if not pending:
+            sleep_fn(poll_interval)
+            current = _file_signature(path)
+            if current == signature or current is None:
+                continue
+            signature = _settled_signature(path, current, debounce, sleep_fn)
+            if signature is None:
+                continue
+
+        pending = False
+        try:
+            text = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError) as error:
+            output_fn(format_status("error", f"Cannot read {path}: {error}"))
+            continue
+        session.refresh(text, output_fn)
+        cycles += 1
+    return 0
+
+
+def _settled_signature(
+    path: Path,
+    signature: tuple[int, int],
+    debounce: float,
+    sleep_fn: Callable[[float], None],
+) -> tuple[int, int] | None:
+    while True:
+        sleep_fn(debounce)
+        current = _file_signature(path)
+        if current == signature:
+            return current
+        if current is None:
+            return None
+        signature = current
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _expression_lines(text: str) -> list[tuple[int, str]]:
+    expressions: list[tuple[int, str]] = []
+    for line_number, line in enumerate(text.splitlines(), start=1):
+        cleaned = line.strip()
+        if cleaned and not cleaned.startswith("#"):
+            expressions.append((line_number, cleaned))
+    return expressions
+
+
+def _summary_text(summary: WatchCycleSummary) -> str:
+    return (
+        f"Cycle {summary.cycle}: {summary.expressions} expressions, "
+        f"{summary.recomputed} recomputed, {summary.reused} reused, "
+        f"{summary.removed} removed, {summary.failed} failed "
+        f"in {summary.elapsed_ms:.1f} ms"
+    )
@@ -0,0 +1,120 @@
+import math
+import random
+
+import pytest
+
+from function_plot_cli.expression import (
+    BATCH,
+    SCALAR,
+    available_backends,
+    calibrate_backends,
+    evaluate_batch,
+    get_backend,
+    reset_calibration,
+    select_backend,
+    validate_and_compile,
+)
+
+_FUNCTIONS = ("sin", "cos", "tan", "sqrt", "log", "exp")
+_OPERATORS = ("+", "-", "*", "/", "**")
+_X_VALUES = [-7.5 + 0.37 * index for index in range(41)]
+
+
+def _random_expression(rng: random.Random, depth: int) -> str:
+    if depth == 0 or rng.random() < 0.25:
+        return rng.choice(["x", "pi", "e", str(rng.randint(1, 5)), f"{rng.uniform(0.1, 3):.3f}"])
+    kind = rng.random()
+    if kind < 0.35:
+        return f"{rng.choice(_FUNCTIONS)}({_random_expression(rng, depth - 1)})"
+    if kind < 0.45:
+        return f"-({_random_expression(rng, depth - 1)})"
+    operator = rng.choice(_OPERATORS)
+    right = str(rng.randint(0, 3)) if operator == "**" else _random_expression(rng, depth - 1)
+    return f"({_random_expression(rng, depth - 1)} {operator} {right})"
+
+
+def _corpus(size: int = 150, seed: int = 20240601) -> list[str]:
+    rng = random.Random(seed)
+    return [_random_expression(rng, 4) for _ in range(size)]
+
+
+def _agree(expected, actual) -> bool:
+    if expected is None or actual is None:
+        return expected is actual
+    return math.isclose(expected, actual, rel_tol=1e-9, abs_tol=1e-9)
+
+
+@pytest.mark.parametrize("expression_text", _corpus())
+def test_batch_backends_agree_on_generated_corpus(expression_text):
+    compiled = validate_and_compile(expression_text)
+    reference = evaluate_batch(compiled, _X_VALUES, backend="tree")
+
+    for name in available_backends(BATCH):
+        results = evaluate_batch(compiled, _X_VALUES, backend=name)
+        mismatches = [
+            (x_value, expected, actual)
+            for x_value, expected, actual in zip(_X_VALUES, reference, results)
+            if not _agree(expected, actual)
+        ]
+        assert not mismatches, f"{name} disagrees with tree backend: {mismatches[:3]}"
+
+
+def test_builtin_backends_declare_capabilities():
+    assert {"tree", "closure"} <= set(available_backends(SCALAR))
+    assert SCALAR in get_backend("tree").capabilities
+
+
+def test_selection_policy_uses_batch_size():
+    assert select_backend(1).name == "tree"
+    assert select_backend(64).min_batch_size <= 64
+
+
+def test_calibration_overrides_default_selection():
+    ticks = iter(range(10_000))
+    try:
+        choices = calibrate_backends(batch_sizes=(1, 100), repeats=1, clock=lambda: next(ticks))
+        assert set(choices) == {1, 100}
+        assert select_backend(500).name == choices[100]
+    finally:
+        reset_calibration()
+
+
+@pytest.mark.parametrize("backend", ["tree", "closure"])
+def test_oversized_integer_literal_is_a_domain_gap(backend):
+    compiled = validate_and_compile("x + 1" + "0" * 400)
+
+    assert evaluate_batch(compiled, _X_VALUES, backend=backend) == [None] * len(_X_VALUES)
+
+
+_EDGE_X_VALUES = [-800.0, -1.0, -0.0, 0.0, 0.5, 1.0, 800.0]
+
+
+@pytest.mark.parametrize(
+    "expression_text",
+    [
+        "1 / exp(x)",
+        "1 / (1 / x)",
+        "0 * exp(x)",
+        "x ** -1",
+        "(x - 1) ** 0.5",
+        "sqrt(x) * 0",
+        "1 / log(x + 1)",
+        "sin(exp(x))",
+        "(x * 1e308) * 10",
+        "1 / ((x * 1e308) * 10)",
+        "exp(x) - exp(x)",
+        "1e400 * 0",
+    ],
+)
+def test_batch_backends_agree_on_overflow_and_domain_edges(expression_text):
+    compiled = validate_and_compile(expression_text)
+    reference = evaluate_batch(compiled, _EDGE_X_VALUES, backend="tree")
+
+    for name in available_backends(BATCH):
+        assert evaluate_batch(compiled, _EDGE_X_VALUES, backend=name) == reference, name
+
+
+def test_numpy_backend_is_registered_when_installed():
+    pytest.importorskip("numpy")
+
+    assert "numpy" in available_backends(BATCH)
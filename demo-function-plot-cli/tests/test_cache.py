@@ -0,0 +1,68 @@
+import os
+
+from function_plot_cli.cache import load_cached_render, render_cache_key, store_cached_render
+from function_plot_cli.expression import DefinitionRegistry, validate_and_compile
+from function_plot_cli.models import PlotConfig
+from function_plot_cli.plotting import build_plot
+from function_plot_cli.renderer import render
+
+
+CONFIG = PlotConfig(x_min=-5, x_max=5, y_min=-5, y_max=5, width=20, height=10)
+
+
+def _store(cache_dir, expression_text, max_entries=64):
+    compiled = validate_and_compile(expression_text)
+    plot = build_plot(compiled, CONFIG)
+    output = render(plot, unicode_mode=False)
+    key = render_cache_key(compiled, CONFIG, False)
+    store_cached_render(cache_dir, key, plot, output, max_entries=max_entries)
+    return key, plot, output
+
+
+def test_cache_round_trips_plot_and_render(tmp_path):
+    key, plot, output = _store(tmp_path, "sin(x)")
+
+    cached = load_cached_render(tmp_path, key)
+
+    assert cached == (plot, output)
+
+
+def test_cache_key_depends_on_config_and_render_mode():
+    compiled = validate_and_compile("x")
+    base = render_cache_key(compiled, CONFIG, False)
+
+    assert base == render_cache_key(validate_and_compile("x"), CONFIG, False)
+    assert base != render_cache_key(compiled, CONFIG, True)
+    assert base != render_cache_key(compiled, PlotConfig(-5, 5, -5, 5, 21, 10), False)
+
+
+def test_cache_key_changes_when_helper_definition_changes():
+    registry = DefinitionRegistry()
+    registry.define("g(u) = u**2")
+    before = render_cache_key(registry.compile("g(x)"), CONFIG, False)
+    registry.define("g(u) = u**3")
+
+    assert render_cache_key(registry.compile("g(x)"), CONFIG, False) != before
+
+
+def test_corrupt_cache_entry_is_discarded(tmp_path):
+    key, _, _ = _store(tmp_path, "x")
+    entry = tmp_path / f"{key}.json"
+    entry.write_text("{bad", encoding="utf-8")
+
+    assert load_cached_render(tmp_path, key) is None
+    assert not entry.exists()
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path):
+    first, _, _ = _store(tmp_path, "x")
+    second, _, _ = _store(tmp_path, "x**2")
+    os.utime(tmp_path / f"{first}.json", (1, 1))
+    os.utime(tmp_path / f"{second}.json", (2, 2))
+    assert load_cached_render(tmp_path, first) is not None
+
+    third, _, _ = _store(tmp_path, "sin(x)", max_entries=2)
+
+    assert load_cached_render(tmp_path, second) is None
+    assert load_cached_render(tmp_path, first) is not None
+    assert load_cached_render(tmp_path, third) is not None
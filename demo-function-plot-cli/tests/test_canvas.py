@@ -0,0 +1,41 @@
+from function_plot_cli.canvas import BitCanvas, layer_table
+
+
+def test_set_and_get_round_trip_across_byte_boundaries():
+    canvas = BitCanvas(width=19, height=3, layers=("curve",))
+    canvas.set("curve", 0, 0)
+    canvas.set("curve", 8, 1)
+    canvas.set("curve", 18, 2)
+    canvas.set("curve", 19, 2)
+
+    assert canvas.get("curve", 0, 0)
+    assert canvas.get("curve", 8, 1)
+    assert canvas.get("curve", 18, 2)
+    assert not canvas.get("curve", 7, 0)
+    assert not canvas.get("curve", 19, 2)
+
+
+def test_encode_cells_prefers_later_layers():
+    canvas = BitCanvas(width=4, height=2, layers=("axis", "curve"))
+    canvas.fill_row("axis", 1)
+    canvas.set("curve", 2, 1)
+    canvas.set("curve", 0, 0)
+    table = layer_table(canvas.layers, {"axis": "-", "curve": "*"})
+
+    assert list(canvas.encode_cells(table)) == ["*   ", "--*-"]
+
+
+def test_encode_braille_maps_pixels_to_dots():
+    canvas = BitCanvas(width=3, height=4, layers=("curve",))
+    canvas.set("curve", 0, 0)
+    canvas.set("curve", 1, 3)
+    canvas.set("curve", 2, 1)
+
+    assert list(canvas.encode_braille()) == ["⢁⠂"]
+
+
+def test_encode_braille_handles_partial_bands():
+    canvas = BitCanvas(width=2, height=5, layers=("axis", "curve"))
+    canvas.fill_column("axis", 0)
+
+    assert list(canvas.encode_braille()) == ["⡇", "⠁"]
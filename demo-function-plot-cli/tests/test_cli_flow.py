@@ -1,15 +1,19 @@
+import json
+import re
 from pathlib import Path
 
 import function_plot_cli.cli as cli_module
 from function_plot_cli.config import AppConfig
 from function_plot_cli.errors import ExpressionValidationError, StorageError
+from function_plot_cli.screen import AnsiScreen
 
 
-def _run_cli(scripted_inputs, monkeypatch, tmp_path):
+def _run_cli(scripted_inputs, monkeypatch, tmp_path, config=None, screen_factory=None):
     outputs = []
     sequence = iter(scripted_inputs)
 
-    monkeypatch.setattr(cli_module, "default_recents_path", lambda: tmp_path / "recents.json")
+    if screen_factory is not None:
+        monkeypatch.setattr(cli_module, "_open_screen", lambda config, output_fn: screen_factory())
 
     def fake_input(prompt: str) -> str:
         outputs.append(prompt)
@@ -18,7 +22,9 @@ def _run_cli(scripted_inputs, monkeypatch, tmp_path):
     cli_module.main(
         input_fn=fake_input,
         output_fn=outputs.append,
-        config=AppConfig(plot_width=30, plot_height=10, unicode_mode=False),
+        config=config or AppConfig(plot_width=30, plot_height=10, unicode_mode=False),
+        recents_path=tmp_path / "recents.json",
+        cache_dir=tmp_path / "cache",
     )
     return outputs
 
@@ -32,6 +38,8 @@ def test_menu_contains_required_options(monkeypatch, tmp_path):
     assert "3) Show recent plots" in all_text
     assert "4) Export current plot to file" in all_text
     assert "5) Exit" in all_text
+    assert "6) Integrate f(x) over [a, b]" in all_text
+    assert all_text.index("6) Integrate") < all_text.index("5) Exit")
 
 
 def test_evaluate_requires_active_function(monkeypatch, tmp_path):
@@ -55,6 +63,22 @@ def test_evaluate_marks_visible_point(monkeypatch, tmp_path):
     assert "Marker placed on visible graph" in all_text
 
 
+def test_evaluate_reuses_the_active_plot_instead_of_resampling(monkeypatch, tmp_path):
+    calls = []
+    original = cli_module.build_plot
+
+    def counting_build_plot(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(cli_module, "build_plot", counting_build_plot)
+    outputs = _run_cli(["1", "x", "2", "0,1", "2", "3", "5"], monkeypatch, tmp_path)
+
+    assert len(calls) == 1
+    assert "Marked 2 of 2 points on visible graph" in "\n".join(outputs)
+    assert "Result: x = 3.000, y = 3.000" in "\n".join(outputs)
+
+
 def test_export_creates_txt_file_with_graph(monkeypatch, tmp_path):
     export_path = tmp_path / "plot.txt"
     outputs = _run_cli(["1", "sin(x)", "4", str(export_path), "5"], monkeypatch, tmp_path)
@@ -78,9 +102,18 @@ def test_evaluate_validation_error_does_not_crash_flow(monkeypatch, tmp_path):
     assert "Bye." in all_text
 
 
+def test_bare_function_name_is_rejected_without_crashing(monkeypatch, tmp_path):
+    outputs = _run_cli(["1", "1 / sin + x", "5"], monkeypatch, tmp_path)
+    all_text = "\n".join(outputs)
+
+    assert "Function sin must be called with an argument." in all_text
+    assert "Function plotted." not in all_text
+    assert "Bye." in all_text
+
+
 def test_recents_write_failure_does_not_crash_plotting_flow(monkeypatch, tmp_path):
-    def raise_storage_error(path, expression_text, max_items=10):
-        del path, expression_text, max_items
+    def raise_storage_error(path, expression_text, max_items=10, key=None):
+        del path, expression_text, max_items, key
         raise StorageError("Could not persist recent plots.")
 
     monkeypatch.setattr(cli_module, "save_recent_function", raise_storage_error)
@@ -90,3 +123,216 @@ def test_recents_write_failure_does_not_crash_plotting_flow(monkeypatch, tmp_pat
     assert "Could not persist recent plots." in all_text
     assert "Function plotted." in all_text
     assert "Bye." in all_text
+
+
+def test_replot_from_recents_uses_render_cache(monkeypatch, tmp_path):
+    _run_cli(["1", "sin(x)", "5"], monkeypatch, tmp_path)
+
+    def fail_build_plot(*args, **kwargs):
+        raise AssertionError("warm replot must not re-evaluate the expression")
+
+    monkeypatch.setattr(cli_module, "build_plot", fail_build_plot)
+    outputs = _run_cli(["3", "1", "5"], monkeypatch, tmp_path)
+    all_text = "\n".join(outputs)
+
+    assert "Function plotted." in all_text
+    assert "Plot Function: f(x) = sin(x)" in all_text
+
+
+def test_fresh_plot_is_rendered_once_and_cached_from_streamed_lines(monkeypatch, tmp_path):
+    calls = []
+    original = cli_module.render_lines
+
+    def counting_render_lines(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(cli_module, "render_lines", counting_render_lines)
+    outputs = _run_cli(["1", "sin(x)", "5"], monkeypatch, tmp_path)
+    monkeypatch.setattr(cli_module, "render_lines", original)
+    cached = _run_cli(["3", "1", "5"], monkeypatch, tmp_path)
+
+    def plot_block(lines):
+        start = lines.index("Plot Function: f(x) = sin(x)")
+        return lines[start : start + 13]
+
+    assert len(calls) == 1
+    assert plot_block(cached) == plot_block(outputs)
+
+
+def test_equivalent_expression_hits_render_cache_with_its_own_text(monkeypatch, tmp_path):
+    _run_cli(["1", "x*2", "5"], monkeypatch, tmp_path)
+
+    def fail_build_plot(*args, **kwargs):
+        raise AssertionError("equivalent expression must reuse the cached plot")
+
+    monkeypatch.setattr(cli_module, "build_plot", fail_build_plot)
+    outputs = _run_cli(["1", "2 * x", "5"], monkeypatch, tmp_path)
+    all_text = "\n".join(outputs)
+
+    assert "Plot Function: f(x) = 2 * x" in all_text
+    assert "x*2" not in all_text
+    assert json.loads((tmp_path / "recents.json").read_text(encoding="utf-8")) == ["2 * x"]
+
+
+def test_screen_mode_falls_back_to_line_output_without_tty(monkeypatch, tmp_path):
+    outputs = _run_cli(["5"], monkeypatch, tmp_path, config=AppConfig(screen_mode=True))
+
+    assert any("1) Plot function" in text for text in outputs)
+    assert not any("\x1b[" in text for text in outputs)
+
+
+def test_screen_mode_redraws_only_changed_regions(monkeypatch, tmp_path):
+    writes = []
+    _run_cli(
+        ["1", "x", "2", "1", "5"],
+        monkeypatch,
+        tmp_path,
+        config=AppConfig(plot_width=30, plot_height=10, unicode_mode=False, screen_mode=True),
+        screen_factory=lambda: AnsiScreen(writes.append, size=lambda: (120, 60)),
+    )
+
+    assert writes[0].count("1) Plot function") == 1
+    assert all("1) Plot function" not in chunk for chunk in writes[1:])
+    assert "Result: x = 1.000, y = 1.000" in "".join(writes)
+
+
+def _emulate_terminal(writes, columns, rows):
+    screen = [[" "] * columns for _ in range(rows)]
+    row = col = 0
+    for token in re.findall(r"\x1b\[[0-9;]*[A-Za-z]|[^\x1b]", "".join(writes)):
+        if not token.startswith("\x1b"):
+            assert row < rows, "output ran past the last terminal row"
+            if col < columns:
+                screen[row][col] = token
+            col += 1
+            continue
+        params, command = token[2:-1], token[-1]
+        if command == "H":
+            row, col = (int(value) - 1 for value in params.split(";"))
+        elif command == "K":
+            start = 0 if params == "2" else col
+            screen[row][start:] = [" "] * (columns - start)
+        elif command == "J":
+            for index in range(0 if params == "2" else row, rows):
+                if params == "2" or index > row:
+                    screen[index] = [" "] * columns
+            if params != "2":
+                screen[row][col:] = [" "] * (columns - col)
+    return ["".join(line).rstrip() for line in screen]
+
+
+def test_screen_mode_fits_default_plot_into_an_80x24_terminal(monkeypatch, tmp_path):
+    writes = []
+    _run_cli(
+        ["1", "sin(x)", "5"],
+        monkeypatch,
+        tmp_path,
+        config=AppConfig(screen_mode=True),
+        screen_factory=lambda: AnsiScreen(writes.append, size=lambda: (80, 24)),
+    )
+
+    lines = _emulate_terminal(writes, 80, 24)
+    assert lines[0].startswith("[1] Plot") and "[5/Q] Exit" in lines[0]
+    assert lines[1] == "Plot Function: f(x) = sin(x)"
+    bottom = next(index for index, line in enumerate(lines) if line.startswith("└"))
+    assert lines[2].startswith("┌") and any("•" in line for line in lines[3:bottom])
+    assert "Render mode: unicode" in lines[bottom + 1 :]
+    assert "[INFO] Bye." in lines
+
+
+def test_progressive_mode_refreshes_plot_region_between_passes(monkeypatch, tmp_path):
+    writes = []
+    _run_cli(
+        ["1", "sin(x)", "5"],
+        monkeypatch,
+        tmp_path,
+        config=AppConfig(plot_width=30, plot_height=10, unicode_mode=False, screen_mode=True, progressive_render=True),
+        screen_factory=lambda: AnsiScreen(writes.append, size=lambda: (120, 60)),
+    )
+
+    plot_writes = [chunk for chunk in writes if "Plot Function: f(x) = sin(x)" in chunk]
+    assert len(plot_writes) == 1
+    refinements = writes[writes.index(plot_writes[0]) + 1 :]
+    assert sum("*" in chunk and "Plot Function" not in chunk for chunk in refinements) >= 2
+    assert "First plot in" in "".join(writes)
+
+
+def test_progressive_mode_without_terminal_prints_only_final_plot(monkeypatch, tmp_path):
+    outputs = _run_cli(
+        ["1", "sin(x)", "5"],
+        monkeypatch,
+        tmp_path,
+        config=AppConfig(plot_width=30, plot_height=10, unicode_mode=False, progressive_render=True),
+    )
+
+    assert outputs.count("Plot Function: f(x) = sin(x)") == 1
+    assert any("First plot in" in text and "full plot in" in text for text in outputs)
+
+
+def test_evaluate_accepts_lists_and_marks_all_points(monkeypatch, tmp_path):
+    outputs = _run_cli(["1", "sqrt(x)", "2", "-1, 0, 4, 25", "5"], monkeypatch, tmp_path)
+    all_text = "\n".join(outputs)
+
+    assert "      -1.000 | domain error" in all_text
+    assert "       4.000 |        2.000" in all_text
+    assert "f(x) is undefined for 1 of 4 values." in all_text
+    assert "Marked 2 of 4 points on visible graph." in all_text
+    assert "Marker: 3 points (2 visible)" in all_text
+
+
+def test_evaluate_accepts_ranges_and_files(monkeypatch, tmp_path):
+    values_path = tmp_path / "xs.txt"
+    values_path.write_text("1\n2\n", encoding="utf-8")
+    outputs = _run_cli(["1", "x", "2", "0:1:0.5", "2", str(values_path), "2", "1:2", "5"], monkeypatch, tmp_path)
+    all_text = "\n".join(outputs)
+
+    assert "Marked 3 of 3 points on visible graph." in all_text
+    assert "Marked 2 of 2 points on visible graph." in all_text
+    assert "x range must look like start:stop:step." in all_text
+
+
+def test_helper_definition_can_be_used_in_later_plots(monkeypatch, tmp_path):
+    outputs = _run_cli(["1", "g(u) = u**2 / 2", "1", "g(x) + 1", "2", "2", "5"], monkeypatch, tmp_path)
+    all_text = "\n".join(outputs)
+
+    assert "Defined g(u) = u**2 / 2" in all_text
+    assert "Result: x = 2.000, y = 3.000" in all_text
+
+
+def test_helper_plots_are_saved_to_recents_in_expanded_form(monkeypatch, tmp_path):
+    _run_cli(["1", "g(u) = u**2 / 2", "1", "g(x) + 1", "5"], monkeypatch, tmp_path)
+
+    assert json.loads((tmp_path / "recents.json").read_text(encoding="utf-8")) == ["x ** 2 / 2 + 1"]
+
+    outputs = _run_cli(["3", "1", "2", "2", "5"], monkeypatch, tmp_path)
+    all_text = "\n".join(outputs)
+    assert "Plot Function: f(x) = x ** 2 / 2 + 1" in all_text
+    assert "Result: x = 2.000, y = 3.000" in all_text
+
+
+def test_evaluate_shows_derivative_readout_when_enabled(monkeypatch, tmp_path):
+    outputs = _run_cli(
+        ["1", "x**2", "2", "3", "5"],
+        monkeypatch,
+        tmp_path,
+        config=AppConfig(plot_width=30, plot_height=10, unicode_mode=False, show_derivative=True),
+    )
+    all_text = "\n".join(outputs)
+
+    assert "Derivative: f'(x) = 6.000" in all_text
+    assert "Derivative: f'(x) drawn with '.'" in all_text
+
+
+def test_integrate_active_function(monkeypatch, tmp_path):
+    outputs = _run_cli(["1", "x**2", "6", "0", "3", "5"], monkeypatch, tmp_path)
+    all_text = "\n".join(outputs)
+
+    assert "Integral: [0, 3] f(x) dx = 9 " in all_text
+
+
+def test_integrate_reports_domain_gap(monkeypatch, tmp_path):
+    outputs = _run_cli(["1", "sqrt(x)", "6", "-1", "1", "5"], monkeypatch, tmp_path)
+    all_text = "\n".join(outputs)
+
+    assert "[ERROR] f(x) is undefined at x = " in all_text
@@ -1,8 +1,11 @@
 import pytest
 
 from function_plot_cli.errors import ExportError
-from function_plot_cli.exporter import export_rendered_plot
-from function_plot_cli.models import RenderOutput
+from function_plot_cli.exporter import export_plot, export_rendered_plot
+from function_plot_cli.expression import validate_and_compile
+from function_plot_cli.models import PlotConfig, RenderOutput
+from function_plot_cli.plotting import build_plot
+from function_plot_cli.renderer import render
 
 
 def _sample_output() -> RenderOutput:
@@ -36,3 +39,14 @@ def test_export_requires_txt_extension(tmp_path):
 def test_export_fails_for_missing_directory(tmp_path):
     with pytest.raises(ExportError):
         export_rendered_plot(tmp_path / "missing" / "plot.txt", _sample_output())
+
+
+def test_export_plot_streams_rendered_lines(tmp_path):
+    plot = build_plot(validate_and_compile("x"), PlotConfig(x_min=-5, x_max=5, y_min=-5, y_max=5, width=20, height=10))
+    export_path = tmp_path / "plot.txt"
+
+    export_plot(export_path, plot, unicode_mode=False)
+
+    content = export_path.read_text(encoding="utf-8")
+    assert content.endswith(render(plot, unicode_mode=False).text + "\n")
+    assert "Render mode: ascii" in content
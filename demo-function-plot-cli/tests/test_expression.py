@@ -1,7 +1,14 @@
+import ast
+
 import pytest
 
 from function_plot_cli.errors import ExpressionDomainError, ExpressionValidationError
-from function_plot_cli.expression import evaluate, validate_and_compile
+from function_plot_cli.expression import (
+    DefinitionRegistry,
+    evaluate,
+    evaluate_with_derivative,
+    validate_and_compile,
+)
 
 
 @pytest.mark.parametrize(
@@ -39,6 +46,8 @@ def test_rejects_unsafe_constructs(expr):
         "x and 1",
         "x > 0",
         "x if x > 0 else -x",
+        "sin + x",
+        "1 / sin + x",
     ],
 )
 def test_rejects_unsupported_ast_forms_at_validation(expr):
@@ -50,3 +59,133 @@ def test_domain_error_is_typed_for_log_zero():
     compiled = validate_and_compile("log(x)")
     with pytest.raises(ExpressionDomainError):
         evaluate(compiled, 0.0)
+
+
+def test_complex_power_result_is_domain_error():
+    compiled = validate_and_compile("x**0.5")
+    with pytest.raises(ExpressionDomainError):
+        evaluate(compiled, -1.0)
+
+
+def test_helper_definitions_are_inlined_and_folded():
+    registry = DefinitionRegistry()
+    registry.define("g(u) = exp(-u**2/2)")
+    compiled = registry.compile("g(x) * (2 + 3)")
+
+    assert compiled.helpers == frozenset({"g"})
+    assert "g(" not in ast.unparse(compiled.ast_tree)
+    assert "5.0" in ast.unparse(compiled.ast_tree)
+    assert evaluate(compiled, 0.0) == pytest.approx(5.0)
+
+
+@pytest.mark.parametrize(
+    "definition",
+    [
+        "g(u) = g(u) + 1",
+        "g(u) = u + x",
+        "sin(u) = u",
+        "g(u) = __import__(u)",
+    ],
+)
+def test_rejects_invalid_helper_definitions(definition):
+    registry = DefinitionRegistry()
+    with pytest.raises(ExpressionValidationError):
+        registry.define(definition)
+
+
+def test_rejects_mutual_recursion_between_helpers():
+    registry = DefinitionRegistry()
+    registry.define("f(u) = u + 1")
+    registry.define("g(u) = f(u) * 2")
+    with pytest.raises(ExpressionValidationError):
+        registry.define("f(u) = g(u)")
+
+
+def test_redefining_helper_invalidates_compiled_cache():
+    registry = DefinitionRegistry()
+    registry.define("g(u) = u**2")
+    assert evaluate(registry.compile("g(x)"), 3.0) == pytest.approx(9.0)
+
+    registry.define("g(u) = u**3")
+
+    assert evaluate(registry.compile("g(x)"), 3.0) == pytest.approx(27.0)
+
+
+def test_helper_names_are_only_valid_as_calls():
+    registry = DefinitionRegistry()
+    registry.define("g(u) = u + 1")
+
+    with pytest.raises(ExpressionValidationError, match="Function g must be called"):
+        registry.compile("g * x")
+    assert evaluate(registry.compile("g(x) * x"), 2.0) == 6.0
+
+
+def test_deeply_nested_helpers_hit_complexity_cap():
+    registry = DefinitionRegistry()
+    registry.define("h(t) = t*t*t*t")
+    with pytest.raises(ExpressionValidationError):
+        registry.compile("h(h(h(h(h(h(h(h(x))))))))")
+
+
+@pytest.mark.parametrize(
+    ("expr", "x", "expected_value", "expected_derivative"),
+    [
+        ("x**2 - 3*x", 2.0, -2.0, 1.0),
+        ("sin(x) * cos(x)", 0.0, 0.0, 1.0),
+        ("tan(x)", 0.0, 0.0, 1.0),
+        ("sqrt(x)", 4.0, 2.0, 0.25),
+        ("log(x) / x", 1.0, 0.0, 1.0),
+        ("exp(2*x)", 0.0, 1.0, 2.0),
+        ("x**x", 1.0, 1.0, 1.0),
+    ],
+)
+def test_dual_evaluation_returns_value_and_derivative(expr, x, expected_value, expected_derivative):
+    value, derivative = evaluate_with_derivative(validate_and_compile(expr), x)
+
+    assert value == pytest.approx(expected_value)
+    assert derivative == pytest.approx(expected_derivative)
+
+
+def test_undefined_derivative_keeps_the_value():
+    assert evaluate_with_derivative(validate_and_compile("sqrt(x)"), 0.0) == (0.0, None)
+
+
+@pytest.mark.parametrize("expr", ["2*x", "x*2", "2 * x", "(2*x)", "x*2.0", "x*(1+1)", "+x*2"])
+def test_equivalent_expressions_share_a_fingerprint(expr):
+    assert validate_and_compile(expr).fingerprint == validate_and_compile("x*2").fingerprint
+
+
+@pytest.mark.parametrize("expr", ["x*3", "x**2", "2/x", "x-2", "sin(2*x)"])
+def test_different_expressions_have_different_fingerprints(expr):
+    assert validate_and_compile(expr).fingerprint != validate_and_compile("x*2").fingerprint
+
+
+def test_fingerprint_tracks_helper_bodies():
+    registry = DefinitionRegistry()
+    registry.define("f(t) = t*2")
+    before = registry.compile("f(x) + 1")
+    registry.define("f(t) = t*3")
+    after = registry.compile("f(x) + 1")
+
+    assert before.fingerprint == validate_and_compile("1 + 2*x").fingerprint
+    assert before.fingerprint != after.fingerprint
+
+
+def test_oversized_integer_literal_compiles_and_fails_at_evaluation():
+    compiled = validate_and_compile("x + 1" + "0" * 400)
+
+    assert compiled.fingerprint != validate_and_compile("x + 1" + "0" * 401).fingerprint
+    with pytest.raises(ExpressionDomainError):
+        evaluate(compiled, 1.0)
+
+
+def test_removing_a_helper_also_removes_its_dependents():
+    registry = DefinitionRegistry()
+    registry.define("g(u) = u*2")
+    registry.define("h(u) = g(u) + 1")
+    registry.define("k(u) = u - 1")
+
+    assert registry.remove("g") == {"g", "h"}
+    assert "k" in registry
+    with pytest.raises(ExpressionValidationError, match="Only approved math functions"):
+        registry.compile("h(x)")
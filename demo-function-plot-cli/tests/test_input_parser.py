@@ -0,0 +1,35 @@
+import pytest
+
+from function_plot_cli.errors import InputValidationError
+from function_plot_cli.input_parser import parse_float_values
+
+
+def test_parses_single_values_lists_and_ranges():
+    assert parse_float_values("2.5") == [2.5]
+    assert parse_float_values("1, -2,3e1") == [1.0, -2.0, 30.0]
+    assert parse_float_values("0:1:0.25") == [0.0, 0.25, 0.5, 0.75, 1.0]
+    assert parse_float_values("1:0:-0.5") == [1.0, 0.5, 0.0]
+
+
+def test_reads_values_from_file(tmp_path):
+    path = tmp_path / "xs.txt"
+    path.write_text("1, 2\n3\n\n-4\n", encoding="utf-8")
+
+    assert parse_float_values(str(path), field_name="x") == [1.0, 2.0, 3.0, -4.0]
+
+
+@pytest.mark.parametrize(
+    ("text", "message"),
+    [
+        ("", "x cannot be empty."),
+        ("abc", "x must be a real number, a comma list"),
+        ("1,a,2", "x must be a real number."),
+        ("0:1", "x range must look like start:stop:step."),
+        ("0:1:0", "x range step must be a non-zero number."),
+        ("0:1:-1", "x range is empty"),
+        ("0:10000:1", "At most 1000 x values"),
+    ],
+)
+def test_rejects_invalid_value_lists(text, message):
+    with pytest.raises(InputValidationError, match=message):
+        parse_float_values(text, field_name="x")
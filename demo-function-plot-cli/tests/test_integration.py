@@ -0,0 +1,79 @@
+import math
+
+import pytest
+
+import function_plot_cli.integration as integration_module
+from function_plot_cli.budget import EvaluationBudget
+from function_plot_cli.errors import ExpressionDomainError
+from function_plot_cli.expression import validate_and_compile
+from function_plot_cli.integration import integrate
+from function_plot_cli.models import PlotConfig
+from function_plot_cli.plotting import build_plot
+
+
+@pytest.mark.parametrize(
+    ("expr", "lower", "upper", "expected"),
+    [
+        ("sin(x)", 0.0, math.pi, 2.0),
+        ("x**2", 0.0, 3.0, 9.0),
+        ("exp(-x**2)", -6.0, 6.0, math.sqrt(math.pi)),
+        ("sqrt(x)", 0.0, 1.0, 2.0 / 3.0),
+        ("x", 2.0, -2.0, 0.0),
+    ],
+)
+def test_integrate_matches_closed_forms(expr, lower, upper, expected):
+    result = integrate(validate_and_compile(expr), lower, upper)
+
+    assert result.converged
+    assert result.value == pytest.approx(expected, abs=1e-7)
+    assert result.error_estimate < 1e-6
+
+
+def test_integrate_seeds_from_plot_samples_and_batches_refinement(monkeypatch):
+    compiled = validate_and_compile("sin(x)")
+    plot = build_plot(compiled, PlotConfig(x_min=-10, x_max=10, y_min=-2, y_max=2, width=64, height=14))
+    batch_sizes = []
+    original = integration_module.evaluate_batch
+
+    def recording_evaluate_batch(compiled, x_values):
+        batch_sizes.append(len(x_values))
+        return original(compiled, x_values)
+
+    monkeypatch.setattr(integration_module, "evaluate_batch", recording_evaluate_batch)
+    result = integrate(compiled, -3.0, 5.0, plot=plot)
+
+    assert result.value == pytest.approx(math.cos(-3.0) - math.cos(5.0), abs=1e-7)
+    assert result.reused_samples > 20
+    assert result.evaluations == sum(batch_sizes)
+    assert max(batch_sizes) > 1
+
+
+def test_integrate_rejects_domain_gaps():
+    with pytest.raises(ExpressionDomainError):
+        integrate(validate_and_compile("log(x)"), -1.0, 1.0)
+
+
+def test_integrate_reports_non_convergence_for_singularity():
+    result = integrate(validate_and_compile("1/x"), -1.0, 1.1, max_evaluations=2000)
+
+    assert result.converged is False
+    assert math.isinf(result.error_estimate)
+
+
+def test_integrate_reports_unbounded_error_when_budget_runs_out():
+    result = integrate(validate_and_compile("tan(x)"), 0.0, 3.0)
+
+    assert result.converged is False
+    assert result.error_estimate == math.inf
+
+
+def test_integrate_ignores_samples_of_a_truncated_plot():
+    compiled = validate_and_compile("x**2")
+    config = PlotConfig(x_min=-10, x_max=10, y_min=-2, y_max=2, width=64, height=14)
+    plot = build_plot(compiled, config, budget=EvaluationBudget(max_evaluations=10, check_every=5))
+
+    result = integrate(compiled, 0.0, 3.0, plot=plot)
+
+    assert plot.truncated
+    assert result.reused_samples == 0
+    assert math.isclose(result.value, 9.0, rel_tol=1e-9)
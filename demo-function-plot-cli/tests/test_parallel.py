@@ -0,0 +1,65 @@
+import function_plot_cli.parallel as parallel_module
+from function_plot_cli.expression import evaluate_batch, validate_and_compile
+from function_plot_cli.models import PlotConfig
+from function_plot_cli.parallel import (
+    PARALLEL_MIN_SAMPLES,
+    sample_in_workers,
+    should_sample_in_workers,
+    shutdown_workers,
+)
+from function_plot_cli.plotting import build_plot
+
+
+def test_small_plots_stay_in_process():
+    assert not should_sample_in_workers(64, workers=4)
+    assert not should_sample_in_workers(PARALLEL_MIN_SAMPLES, workers=1)
+    assert should_sample_in_workers(PARALLEL_MIN_SAMPLES, workers=2)
+
+
+def test_workers_match_in_process_samples_including_domain_gaps():
+    compiled = validate_and_compile("sqrt(x) + 1 / x")
+    x_values = [index / 10 - 5 for index in range(101)]
+    try:
+        samples, derivative_samples = sample_in_workers(compiled, x_values, derivative=True, workers=3)
+    finally:
+        shutdown_workers()
+
+    assert samples == evaluate_batch(compiled, x_values)
+    assert samples[0] is None
+    assert samples[50] is None
+    assert len(derivative_samples) == len(x_values)
+    assert derivative_samples[75] is not None
+
+
+def test_build_plot_with_workers_matches_single_process_plot():
+    compiled = validate_and_compile("sin(x) * x")
+    config = PlotConfig(x_min=-10, x_max=10, y_min=-10, y_max=10, width=PARALLEL_MIN_SAMPLES, height=40)
+    try:
+        parallel = build_plot(compiled, config, workers=2)
+    finally:
+        shutdown_workers()
+    serial = build_plot(compiled, config)
+
+    assert parallel.samples == serial.samples
+    assert parallel.points == serial.points
+
+
+def test_one_pool_serves_different_expressions(monkeypatch):
+    started = []
+    original = parallel_module.ProcessPoolExecutor
+
+    def counting_pool(*args, **kwargs):
+        started.append(kwargs.get("max_workers"))
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(parallel_module, "ProcessPoolExecutor", counting_pool)
+    x_values = [index / 10 for index in range(50)]
+    try:
+        for text in ("x * 2", "sin(x)", "x * 2"):
+            compiled = validate_and_compile(text)
+            samples, _ = sample_in_workers(compiled, x_values, derivative=False, workers=2)
+            assert samples == evaluate_batch(compiled, x_values)
+    finally:
+        shutdown_workers()
+
+    assert started == [2]
@@ -1,6 +1,13 @@
+import threading
+
+import pytest
+
+import function_plot_cli.plotting as plotting_module
+from function_plot_cli.budget import CancellationToken, EvaluationBudget
+from function_plot_cli.errors import EvaluationBudgetError, EvaluationCancelledError
 from function_plot_cli.expression import validate_and_compile
 from function_plot_cli.models import MarkedPoint, PlotConfig
-from function_plot_cli.plotting import build_plot, marker_cell
+from function_plot_cli.plotting import build_plot, build_plot_progressive, marker_cells, robust_y_range, with_markers
 
 
 def _config() -> PlotConfig:
@@ -19,18 +26,153 @@ def test_build_plot_creates_points_and_axes():
 def test_marker_visible_and_mapped_to_cell():
     compiled = validate_and_compile("x")
     marker = MarkedPoint(x=2.0, y=2.0)
-    plot = build_plot(compiled, _config(), marker)
+    plot = build_plot(compiled, _config(), [marker])
 
-    assert plot.marker is not None
-    assert plot.marker.visible is True
-    assert marker_cell(plot) is not None
+    assert len(plot.markers) == 1
+    assert plot.markers[0].visible is True
+    assert len(marker_cells(plot)) == 1
 
 
 def test_marker_outside_viewport_is_not_visible():
     compiled = validate_and_compile("x")
     marker = MarkedPoint(x=100.0, y=100.0)
-    plot = build_plot(compiled, _config(), marker)
+    plot = build_plot(compiled, _config(), [marker])
+
+    assert len(plot.markers) == 1
+    assert plot.markers[0].visible is False
+    assert marker_cells(plot) == []
+
+
+def test_with_markers_matches_a_rebuilt_plot():
+    compiled = validate_and_compile("x")
+    markers = [MarkedPoint(x=2.0, y=2.0), MarkedPoint(x=100.0, y=100.0)]
+    plot = build_plot(compiled, _config())
+
+    assert with_markers(plot, markers) == build_plot(compiled, _config(), markers)
+    assert plot.markers == ()
+
+
+def test_auto_y_range_fits_samples_without_reevaluating(monkeypatch):
+    calls = []
+    original = plotting_module.evaluate_batch
+
+    def counting_evaluate_batch(compiled, x_values):
+        calls.append(len(x_values))
+        return original(compiled, x_values)
+
+    monkeypatch.setattr(plotting_module, "evaluate_batch", counting_evaluate_batch)
+    config = PlotConfig(x_min=0, x_max=10, y_min=-10, y_max=10, width=40, height=14, auto_y=True)
+    plot = build_plot(validate_and_compile("x**3"), config)
+
+    assert calls == [40]
+    assert plot.clipped_points == 0
+    assert plot.config.y_max >= 1000
+    assert plot.config.y_min < 0 < plot.config.y_max
+
+
+def test_robust_y_range_trims_asymptotes():
+    samples = [float(value) for value in range(-10, 11)] * 5 + [1e9, -1e9, None]
+    y_min, y_max = robust_y_range(samples, -1.0, 1.0)
+
+    assert -12 < y_min < -8
+    assert 8 < y_max < 12
+
+
+def test_robust_y_range_keeps_tails_that_are_not_outliers():
+    samples = [float(value) for value in range(-10, 11)]
+    y_min, y_max = robust_y_range(samples, -1.0, 1.0)
+
+    assert y_min < -10 and y_max > 10
+    assert robust_y_range([value * value for value in samples], -1.0, 1.0)[1] > 100
+
+
+def test_robust_y_range_handles_constant_and_empty_samples():
+    assert robust_y_range([2.0, 2.0], -10, 10) == (1.0, 3.0)
+    assert robust_y_range([None, None], -10, 10) == (-10, 10)
+
+
+def test_derivative_overlay_is_sampled_with_the_function():
+    config = PlotConfig(x_min=-10, x_max=10, y_min=-10, y_max=10, width=40, height=14, derivative=True)
+    plot = build_plot(validate_and_compile("x**2 / 4"), config)
+
+    assert len(plot.derivative_samples) == 40
+    assert plot.derivative_samples[0] == pytest.approx(-5.0)
+    assert plot.derivative_points
+
+
+def test_evaluation_budget_truncates_plot():
+    budget = EvaluationBudget(max_evaluations=10, check_every=4)
+    plot = build_plot(validate_and_compile("x"), _config(), budget=budget)
+
+    assert plot.truncated is True
+    assert sum(1 for value in plot.samples if value is not None) == 10
+    assert len(plot.samples) == 40
+
+
+def test_deadline_can_raise_dedicated_error():
+    ticks = iter([0.0, 0.5, 2.0, 3.0])
+    budget = EvaluationBudget(deadline_seconds=1.0, check_every=8, on_exhausted="raise", clock=lambda: next(ticks))
+
+    with pytest.raises(EvaluationBudgetError):
+        build_plot(validate_and_compile("sin(x)"), _config(), budget=budget)
+
+
+def test_cancellation_token_stops_sampling_from_another_thread():
+    token = CancellationToken()
+    worker = threading.Thread(target=token.cancel)
+    worker.start()
+    worker.join()
+
+    plot = build_plot(validate_and_compile("x"), _config(), cancel_token=token)
+    assert plot.truncated is True
+    assert plot.points == set()
+
+    with pytest.raises(EvaluationCancelledError):
+        build_plot(validate_and_compile("x"), _config(), budget=EvaluationBudget(on_exhausted="raise"), cancel_token=token)
+
+
+def test_budget_that_is_not_exhausted_matches_unbudgeted_plot():
+    compiled = validate_and_compile("sin(x)")
+    plot = build_plot(compiled, _config(), budget=EvaluationBudget(deadline_seconds=60, check_every=7))
+
+    assert plot.truncated is False
+    assert plot.points == build_plot(compiled, _config()).points
+
+
+def test_progressive_plot_refines_to_the_single_pass_result():
+    compiled = validate_and_compile("sin(x) * x")
+    config = PlotConfig(x_min=-5, x_max=5, y_min=-5, y_max=5, width=37, height=12, auto_y=True, derivative=True)
+
+    passes = list(build_plot_progressive(compiled, config, stride=8))
+    final = build_plot(compiled, config)
+
+    assert len(passes) == 4
+    assert sum(sample is not None for sample in passes[0].samples) == 6
+    assert passes[-1].samples == final.samples
+    assert passes[-1].derivative_samples == final.derivative_samples
+    assert passes[-1].points == final.points
+    assert passes[-1].config == final.config
+
+
+def test_progressive_plot_evaluates_each_column_once(monkeypatch):
+    calls = []
+    original = plotting_module.evaluate_batch
+
+    def counting_batch(compiled, x_values, backend=None):
+        calls.append(len(x_values))
+        return original(compiled, x_values, backend)
+
+    monkeypatch.setattr(plotting_module, "evaluate_batch", counting_batch)
+    list(build_plot_progressive(validate_and_compile("x"), _config(), stride=4))
+
+    assert sum(calls) == _config().width
+
+
+def test_progressive_plot_stops_when_budget_runs_out():
+    compiled = validate_and_compile("x")
+    budget = EvaluationBudget(max_evaluations=10, check_every=4)
+
+    passes = list(build_plot_progressive(compiled, _config(), budget=budget, stride=4))
 
-    assert plot.marker is not None
-    assert plot.marker.visible is False
-    assert marker_cell(plot) is None
+    assert passes[-1].truncated
+    assert sum(sample is not None for sample in passes[-1].samples) == 10
@@ -1,7 +1,7 @@
 from function_plot_cli.expression import validate_and_compile
 from function_plot_cli.models import MarkedPoint, PlotConfig
 from function_plot_cli.plotting import build_plot
-from function_plot_cli.renderer import render
+from function_plot_cli.renderer import render, render_lines
 
 
 CONFIG = PlotConfig(x_min=-5, x_max=5, y_min=-5, y_max=5, width=20, height=10)
@@ -20,7 +20,7 @@ def test_renderer_is_deterministic_for_same_input():
 def test_marker_overrides_curve_symbol_when_visible():
     compiled = validate_and_compile("x")
     marker = MarkedPoint(x=0.0, y=0.0)
-    plot = build_plot(compiled, CONFIG, marker)
+    plot = build_plot(compiled, CONFIG, [marker])
     output = render(plot, unicode_mode=False)
 
     assert "Marker: (0.000, 0.000)" in output.text
@@ -34,3 +34,53 @@ def test_ascii_mode_uses_ascii_symbols():
 
     assert "+" in output.text
     assert "*" in output.text
+
+
+def test_render_lines_streams_the_same_text_as_render():
+    compiled = validate_and_compile("sin(x)")
+    plot = build_plot(compiled, CONFIG, [MarkedPoint(x=0.0, y=0.0)])
+
+    lines = render_lines(plot, unicode_mode=True)
+
+    assert next(lines) == "Plot Function: f(x) = sin(x)"
+    assert "\n".join(["Plot Function: f(x) = sin(x)", *lines]) == render(plot).text
+
+
+def test_auto_y_range_is_reported_in_metadata():
+    config = PlotConfig(x_min=0, x_max=1, y_min=-5, y_max=5, width=20, height=10, auto_y=True)
+    plot = build_plot(validate_and_compile("100 + x"), config)
+    output = render(plot, unicode_mode=False)
+
+    assert output.metadata["y_range_mode"] == "auto"
+    assert output.metadata["y_range"] == f"[{plot.config.y_min:g},{plot.config.y_max:g}]"
+    assert "(auto y)" in output.text
+
+
+def test_braille_mode_packs_two_by_four_pixels_per_cell():
+    compiled = validate_and_compile("sin(x)")
+    config = PlotConfig(x_min=-5, x_max=5, y_min=-2, y_max=2, width=40, height=40)
+    output = render(build_plot(compiled, config), braille=True)
+    frame = output.text.splitlines()[1 : 1 + 12]
+
+    assert output.metadata["render_mode"] == "braille"
+    assert "Render mode: braille" in output.text
+    assert len(frame[0]) == 20 + 2
+    assert sum(1 for line in frame[1:-1] if line.startswith("│")) == 10
+    assert any("⠀" < char <= "⣿" for line in frame for char in line)
+
+
+def test_braille_is_ignored_in_ascii_mode():
+    compiled = validate_and_compile("x")
+    plot = build_plot(compiled, CONFIG)
+
+    assert render(plot, unicode_mode=False, braille=True).text == render(plot, unicode_mode=False).text
+
+
+def test_all_visible_markers_are_drawn_in_one_render():
+    compiled = validate_and_compile("x")
+    markers = [MarkedPoint(x=-4.0, y=-4.0), MarkedPoint(x=0.0, y=0.0), MarkedPoint(x=4.0, y=4.0), MarkedPoint(x=9.0, y=9.0)]
+    output = render(build_plot(compiled, CONFIG, markers), unicode_mode=False)
+    graph = "\n".join(output.text.splitlines()[2:12])
+
+    assert graph.count("o") == 3
+    assert "Marker: 4 points (3 visible)" in output.text
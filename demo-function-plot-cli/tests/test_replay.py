@@ -0,0 +1,66 @@
+import json
+
+from function_plot_cli.benchmark import benchmark_render, update_benchmark_json
+from function_plot_cli.config import AppConfig
+from function_plot_cli.replay import replay_session
+
+
+def test_replay_reports_percentiles_per_action(tmp_path):
+    results = replay_session(
+        repeat=3,
+        config=AppConfig(plot_width=30, plot_height=10, unicode_mode=False),
+        work_dir=tmp_path,
+    )
+
+    assert set(results["actions"]) == {"plot", "mark", "recents", "export"}
+    for stats in results["actions"].values():
+        assert stats["count"] == 3
+        assert stats["warm_count"] == 2
+        assert stats["cold_ms"] >= 0
+        assert 0 <= stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"]
+    assert results["output_bytes"] > 0
+    assert (tmp_path / "replay-export.txt").exists()
+    assert json.loads((tmp_path / "recents.json").read_text(encoding="utf-8")) == ["sin(x) * exp(-x**2 / 20)"]
+
+
+def test_replay_uses_custom_script_and_clock(tmp_path):
+    ticks = iter(range(0, 1000, 2))
+    script = [("plot", ["1", "x"]), ("bad", ["9"])]
+
+    results = replay_session(script, repeat=2, work_dir=tmp_path, clock=lambda: next(ticks) / 1000.0)
+
+    assert results["actions"]["plot"]["cold_ms"] == 2.0
+    assert results["actions"]["plot"]["p50_ms"] == 2.0
+    assert results["actions"]["bad"]["count"] == 2
+
+
+def test_replay_single_repeat_reports_only_the_cold_pass(tmp_path):
+    results = replay_session([("plot", ["1", "x"])], repeat=1, work_dir=tmp_path)
+
+    stats = results["actions"]["plot"]
+    assert stats["warm_count"] == 0
+    assert stats["cold_ms"] >= 0
+    assert stats["p50_ms"] is None
+    assert (tmp_path / "cache").is_dir()
+
+
+def test_update_benchmark_json_keeps_other_sections(tmp_path):
+    path = tmp_path / "benchmark.json"
+    path.write_text(json.dumps({"render": {"ok": True}}), encoding="utf-8")
+
+    update_benchmark_json(path, "replay", {"total_ms": 1.5})
+
+    content = json.loads(path.read_text(encoding="utf-8"))
+    assert content["render"] == {"ok": True}
+    assert content["replay"]["total_ms"] == 1.5
+    assert "python" in content["environment"]
+
+
+def test_benchmark_render_reports_each_renderer():
+    results = benchmark_render(sizes=((16, 6),), repeats=1)
+    entry = results["sizes"][0]
+
+    assert (entry["width"], entry["height"]) == (16, 6)
+    for name in ("grid", "canvas", "braille"):
+        assert entry[name]["best_ms"] >= 0
+        assert entry[name]["peak_kib"] > 0
@@ -0,0 +1,74 @@
+from function_plot_cli.screen import AnsiScreen
+
+
+def _screen(size=(80, 24)):
+    writes = []
+    return AnsiScreen(writes.append, regions=("menu", "plot"), size=lambda: size), writes
+
+
+def test_first_refresh_clears_and_draws_every_line():
+    screen, writes = _screen()
+    screen.set_region("menu", "line one\nline two")
+    screen.refresh()
+
+    assert writes[0].startswith("\x1b[2J")
+    assert "\x1b[1;1Hline one" in writes[0]
+    assert "\x1b[2;1Hline two" in writes[0]
+
+
+def test_refresh_without_changes_only_moves_cursor():
+    screen, writes = _screen()
+    screen.set_region("menu", "line one\nline two")
+    screen.refresh()
+    screen.set_region("menu", "line one\nline two")
+    screen.refresh()
+
+    assert writes[1] == "\x1b[3;1H\x1b[J"
+
+
+def test_refresh_writes_only_changed_span():
+    screen, writes = _screen()
+    screen.set_region("menu", "Active: sin(x)  \nstatic")
+    screen.refresh()
+    screen.set_region("menu", "Active: cos(x)  \nstatic")
+    screen.refresh()
+
+    assert writes[1].startswith("\x1b[1;9Hcos")
+    assert "static" not in writes[1]
+
+
+def test_shrinking_frame_clears_stale_lines():
+    screen, writes = _screen()
+    screen.set_region("menu", "menu")
+    screen.set_region("plot", "row 1\nrow 2")
+    screen.refresh()
+    screen.set_region("plot", "row 1")
+    screen.refresh()
+
+    assert "\x1b[3;1H\x1b[2K" in writes[1]
+
+
+def test_frame_is_clipped_to_the_terminal():
+    screen, writes = _screen(size=(6, 5))
+    screen.set_region("menu", "menu line")
+    screen.set_region("plot", "\n".join(f"row {index}" for index in range(10)))
+    screen.refresh()
+
+    assert "\x1b[1;1Hmenu l" in writes[0]
+    assert "\x1b[2;1Hrow 8" in writes[0]
+    assert "\x1b[3;1Hrow 9" in writes[0]
+    assert "row 7" not in writes[0]
+    assert writes[0].endswith("\x1b[4;1H\x1b[J")
+
+
+def test_resize_forces_a_full_redraw():
+    size = [80, 24]
+    writes = []
+    screen = AnsiScreen(writes.append, regions=("menu",), size=lambda: tuple(size))
+    screen.set_region("menu", "line one")
+    screen.refresh()
+    size[1] = 20
+    screen.refresh()
+
+    assert writes[1].startswith("\x1b[2J")
+    assert "\x1b[1;1Hline one" in writes[1]
@@ -32,3 +32,12 @@ def test_save_caps_recents_at_10(tmp_path):
     assert len(recents) == 10
     assert recents[0] == "x+11"
     assert recents[-1] == "x+2"
+
+
+def test_save_deduplicates_by_key_and_keeps_new_text(tmp_path):
+    path = tmp_path / "recents.json"
+    save_recent_function(path, "x*2")
+    save_recent_function(path, "sin(x)")
+    recents = save_recent_function(path, "2 * x", key=lambda text: text.replace(" ", "").replace("x*2", "2*x"))
+
+    assert recents == ["2 * x", "sin(x)"]
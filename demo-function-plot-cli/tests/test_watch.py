@@ -0,0 +1,101 @@
+from function_plot_cli.budget import EvaluationBudget
+from function_plot_cli.config import AppConfig
+from function_plot_cli.models import PlotConfig
+from function_plot_cli.watch import WatchSession, watch_file
+
+
+CONFIG = PlotConfig(x_min=-5, x_max=5, y_min=-5, y_max=5, width=20, height=10)
+
+
+def test_refresh_recomputes_only_changed_lines():
+    session = WatchSession(CONFIG, unicode_mode=False)
+    outputs = []
+    first = session.refresh("sin(x)\n# comment\nx**2\ncos(x)\n", outputs.append)
+    outputs.clear()
+
+    second = session.refresh("sin(x)\n# comment\nx**3\ncos(x)\n", outputs.append)
+
+    assert (first.recomputed, first.reused) == (3, 0)
+    assert (second.recomputed, second.reused, second.removed) == (1, 2, 1)
+    assert "Line 3:" in outputs
+    assert not any("f(x) = sin(x)" in text for text in outputs)
+
+
+def test_refresh_reports_invalid_lines_without_stopping():
+    session = WatchSession(CONFIG, unicode_mode=False)
+    outputs = []
+
+    summary = session.refresh("x +\nx\n", outputs.append)
+
+    assert summary.failed == 1
+    assert any("Line 1: Invalid expression syntax." in text for text in outputs)
+    assert any("Cycle 1: 2 expressions" in text for text in outputs)
+
+
+def test_watch_file_debounces_and_replots_on_change(tmp_path):
+    path = tmp_path / "exprs.txt"
+    path.write_text("x\n", encoding="utf-8")
+    outputs = []
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        if len(sleeps) == 1:
+            path.write_text("x\nsin(x)\n", encoding="utf-8")
+
+    watch_file(
+        path,
+        AppConfig(unicode_mode=False),
+        CONFIG,
+        output_fn=outputs.append,
+        poll_interval=0.5,
+        debounce=0.1,
+        max_cycles=2,
+        sleep_fn=fake_sleep,
+    )
+
+    summaries = [text for text in outputs if "Cycle" in text]
+    assert len(summaries) == 2
+    assert "1 recomputed, 1 reused" in summaries[1]
+    assert sleeps == [0.5, 0.1]
+
+
+def test_changing_a_definition_replots_only_its_callers():
+    session = WatchSession(CONFIG, unicode_mode=False)
+    session.refresh("g(u) = u**2\ng(x)\nsin(x)\n", lambda text: None)
+
+    summary = session.refresh("g(u) = u**3\ng(x)\nsin(x)\n", lambda text: None)
+
+    assert (summary.recomputed, summary.reused, summary.failed) == (1, 1, 0)
+
+
+def test_equivalent_lines_reuse_samples_but_show_their_own_text():
+    session = WatchSession(CONFIG, unicode_mode=False)
+    outputs = []
+
+    summary = session.refresh("2*x\nx * 2\n", outputs.append)
+
+    assert (summary.recomputed, summary.reused) == (1, 1)
+    assert any("f(x) = x * 2" in text for text in outputs)
+
+
+def test_removing_a_helper_reports_its_dependents_instead_of_crashing():
+    session = WatchSession(CONFIG, unicode_mode=False)
+    session.refresh("g(u) = u*2\nh(u) = g(u) + 1\nh(x)\n", lambda text: None)
+    outputs = []
+
+    summary = session.refresh("h(u) = g(u) + 1\nh(x)\n", outputs.append)
+    restored = session.refresh("g(u) = u*3\nh(u) = g(u) + 1\nh(x)\n", outputs.append)
+
+    assert summary.failed == 1
+    assert any("Line 2: Only approved math functions are allowed." in text for text in outputs)
+    assert restored.failed == 0
+
+
+def test_truncated_plots_are_resampled_on_the_next_cycle():
+    session = WatchSession(CONFIG, unicode_mode=False, budget=EvaluationBudget(max_evaluations=5, check_every=5))
+
+    first = session.refresh("x\n", lambda text: None)
+    second = session.refresh("x\n", lambda text: None)
+
+    assert (first.recomputed, second.recomputed, second.reused) == (1, 1, 0)